@@ -9,8 +9,10 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 from app.db.database import Base
+from app.models.workspace import Workspace
 from app.models.user import User
 from app.models.task import Task
+from app.models.recurring_task import RecurringTask
 from app.core.config import settings
 
 config = context.config
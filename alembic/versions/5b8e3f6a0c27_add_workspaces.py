@@ -0,0 +1,52 @@
+"""Add workspaces and tenant-leading indexes
+
+Revision ID: 5b8e3f6a0c27
+Revises: 9c1d7e2b5a41
+Create Date: 2026-10-19 14:41:09.562118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '5b8e3f6a0c27'
+down_revision = '9c1d7e2b5a41'
+branch_labels = None
+depends_on = None
+
+TENANT_TABLES = ('users', 'tasks', 'recurring_tasks')
+
+
+def upgrade() -> None:
+    op.create_table('workspaces',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    # Existing data moves into a single default workspace
+    op.execute("INSERT INTO workspaces (id, name) VALUES (gen_random_uuid(), 'Default')")
+    for table in TENANT_TABLES:
+        op.add_column(table, sa.Column('workspace_id', sa.UUID(), nullable=True))
+        op.execute(f"UPDATE {table} SET workspace_id = (SELECT id FROM workspaces LIMIT 1)")
+        op.alter_column(table, 'workspace_id', nullable=False)
+        op.create_foreign_key(f'{table}_workspace_id_fkey', table, 'workspaces', ['workspace_id'], ['id'])
+
+    op.create_index('ix_users_workspace_id_id', 'users', ['workspace_id', 'id'], unique=False)
+    op.create_index('ix_tasks_workspace_id_id', 'tasks', ['workspace_id', 'id'], unique=False)
+    op.create_index('ix_tasks_workspace_id_assignee_id', 'tasks', ['workspace_id', 'assignee_id', 'id'], unique=False)
+    op.create_index('ix_tasks_workspace_id_created_by', 'tasks', ['workspace_id', 'created_by', 'id'], unique=False)
+    op.create_index('ix_recurring_tasks_workspace_id_id', 'recurring_tasks', ['workspace_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_recurring_tasks_workspace_id_id', table_name='recurring_tasks')
+    op.drop_index('ix_tasks_workspace_id_created_by', table_name='tasks')
+    op.drop_index('ix_tasks_workspace_id_assignee_id', table_name='tasks')
+    op.drop_index('ix_tasks_workspace_id_id', table_name='tasks')
+    op.drop_index('ix_users_workspace_id_id', table_name='users')
+    for table in TENANT_TABLES:
+        op.drop_constraint(f'{table}_workspace_id_fkey', table, type_='foreignkey')
+        op.drop_column(table, 'workspace_id')
+    op.drop_table('workspaces')
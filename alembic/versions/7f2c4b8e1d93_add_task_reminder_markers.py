@@ -0,0 +1,25 @@
+"""Add task reminder markers
+
+Revision ID: 7f2c4b8e1d93
+Revises: e41a7c9d3f58
+Create Date: 2026-10-20 09:14:52.603118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '7f2c4b8e1d93'
+down_revision = 'e41a7c9d3f58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('tasks', sa.Column('due_soon_reminder_for', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('tasks', sa.Column('overdue_reminder_for', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('tasks', 'overdue_reminder_for')
+    op.drop_column('tasks', 'due_soon_reminder_for')
@@ -0,0 +1,54 @@
+"""Add recurring tasks and open due date index
+
+Revision ID: 9c1d7e2b5a41
+Revises: 4023f92aab84
+Create Date: 2026-10-19 10:12:44.218305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = '9c1d7e2b5a41'
+down_revision = '4023f92aab84'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('recurring_tasks',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('priority', postgresql.ENUM('low', 'medium', 'high', 'urgent', name='taskpriority', create_type=False), nullable=False),
+    sa.Column('assignee_id', sa.UUID(), nullable=True),
+    sa.Column('created_by', sa.UUID(), nullable=False),
+    sa.Column('frequency', sa.Enum('daily', 'weekly', 'cron', name='recurrencefrequency'), nullable=False),
+    sa.Column('interval', sa.Integer(), nullable=False),
+    sa.Column('weekdays', sa.String(), nullable=True),
+    sa.Column('cron_expression', sa.String(), nullable=True),
+    sa.Column('start_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('next_run_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['assignee_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_recurring_tasks_next_run_at', 'recurring_tasks', ['next_run_at'], unique=False, postgresql_where=sa.text('is_active'))
+    op.add_column('tasks', sa.Column('recurring_task_id', sa.UUID(), nullable=True))
+    op.create_foreign_key('tasks_recurring_task_id_fkey', 'tasks', 'recurring_tasks', ['recurring_task_id'], ['id'])
+    op.create_unique_constraint('uq_tasks_recurring_occurrence', 'tasks', ['recurring_task_id', 'due_date'])
+    op.create_index('ix_tasks_due_open', 'tasks', ['due_date', 'id'], unique=False, postgresql_where=sa.text("is_active AND status NOT IN ('completed', 'cancelled')"))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_due_open', table_name='tasks')
+    op.drop_constraint('uq_tasks_recurring_occurrence', 'tasks', type_='unique')
+    op.drop_constraint('tasks_recurring_task_id_fkey', 'tasks', type_='foreignkey')
+    op.drop_column('tasks', 'recurring_task_id')
+    op.drop_index('ix_recurring_tasks_next_run_at', table_name='recurring_tasks')
+    op.drop_table('recurring_tasks')
+    sa.Enum(name='recurrencefrequency').drop(op.get_bind(), checkfirst=True)
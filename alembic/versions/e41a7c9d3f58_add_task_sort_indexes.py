@@ -0,0 +1,33 @@
+"""Add task sort indexes
+
+Revision ID: e41a7c9d3f58
+Revises: 5b8e3f6a0c27
+Create Date: 2026-10-19 16:02:37.184263
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'e41a7c9d3f58'
+down_revision = '5b8e3f6a0c27'
+branch_labels = None
+depends_on = None
+
+SORT_COLUMNS = ('due_date', 'priority', 'updated_at')
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY keeps tasks writable while the indexes build,
+    # but cannot run inside the migration's transaction
+    with op.get_context().autocommit_block():
+        for column in SORT_COLUMNS:
+            op.create_index(f'ix_tasks_workspace_id_{column}', 'tasks', ['workspace_id', column, 'id'], unique=False, postgresql_concurrently=True)
+            op.create_index(f'ix_tasks_workspace_id_assignee_id_{column}', 'tasks', ['workspace_id', 'assignee_id', column, 'id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in reversed(SORT_COLUMNS):
+            op.drop_index(f'ix_tasks_workspace_id_assignee_id_{column}', table_name='tasks', postgresql_concurrently=True)
+            op.drop_index(f'ix_tasks_workspace_id_{column}', table_name='tasks', postgresql_concurrently=True)
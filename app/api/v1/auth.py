@@ -31,6 +31,10 @@ async def get_current_user(
     if user is None:
         raise credentials_exception
 
+    # The token is only valid in the workspace (and shard) it was issued for
+    if payload.get("ws") != str(user.workspace_id):
+        raise credentials_exception
+
     return user
 
 
@@ -60,11 +64,14 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token = create_access_token(data={"sub": user.username})
+    access_token = create_access_token(
+        data={"sub": user.username, "ws": str(user.workspace_id)}
+    )
     return {
         "access_token": access_token,
         "token_type": "bearer",
         "user_id": user.id,
         "username": user.username,
         "is_admin": user.is_admin,
+        "workspace_id": user.workspace_id,
     }
@@ -0,0 +1,58 @@
+from fastapi import HTTPException, Query, status
+from sqlalchemy.orm import Query as SQLQuery, Session
+from typing import Hashable, Optional, Sequence
+from app.db.pagination import (
+    SortKey,
+    count_rows,
+    decode_cursor,
+    paginate,
+    parse_cursor,
+)
+from app.schemas.pagination import CountMode
+
+
+class PageParams:
+    def __init__(
+        self,
+        skip: int = Query(0, ge=0, description="Number of records to skip"),
+        limit: int = Query(10, ge=1, le=100, description="Number of records to return"),
+        cursor: Optional[str] = Query(
+            None, description="Opaque cursor from a previous page's next_cursor"
+        ),
+        count: CountMode = Query(
+            CountMode.estimated, description="How to compute total: exact, estimated or none"
+        ),
+    ):
+        self.skip = skip
+        self.limit = limit
+        self.count = count
+        try:
+            self.after = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+
+    def page(
+        self,
+        db: Session,
+        query: SQLQuery,
+        key,
+        cache_key: Hashable,
+        sort: Sequence[SortKey] = (),
+    ):
+        after = None
+        if self.after:
+            try:
+                after = parse_cursor(
+                    self.after, key, db.get_bind().dialect.name, sort=sort
+                )
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+                )
+        total = count_rows(db, query, self.count, cache_key)
+        items, next_cursor = paginate(
+            query, key, self.limit, after=after, skip=self.skip, sort=sort
+        )
+        return items, next_cursor, total
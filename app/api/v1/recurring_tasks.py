@@ -0,0 +1,112 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
+from app.db.database import get_db
+from app.models.user import User
+from app.models.recurring_task import RecurringTask
+from app.schemas.pagination import Page
+from app.schemas.recurring_task import RecurringTaskCreate, RecurringTaskResponse
+from app.services.recurrence import as_utc, format_weekdays, next_run
+from app.services.user_lookup import user_lookup
+from app.api.v1.auth import get_current_active_user
+from app.api.v1.pagination import PageParams
+from uuid import UUID
+
+router = APIRouter()
+
+
+@router.post(
+    "/", response_model=RecurringTaskResponse, status_code=status.HTTP_201_CREATED
+)
+def create_recurring_task(
+    rule: RecurringTaskCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    if rule.assignee_id:
+        assignee = user_lookup.by_id(db, rule.assignee_id)
+        if not assignee or assignee.workspace_id != current_user.workspace_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Assignee not found"
+            )
+
+    db_rule = RecurringTask(
+        workspace_id=current_user.workspace_id,
+        title=rule.title,
+        description=rule.description,
+        priority=rule.priority,
+        assignee_id=rule.assignee_id,
+        created_by=current_user.id,
+        frequency=rule.frequency,
+        interval=rule.interval,
+        weekdays=format_weekdays(rule.weekdays) if rule.weekdays else None,
+        cron_expression=rule.cron_expression,
+        start_at=rule.start_at,
+    )
+    # Occurrences in the past are not backfilled
+    first_run = max(datetime.now(timezone.utc), as_utc(rule.start_at))
+    try:
+        db_rule.next_run_at = next_run(db_rule, first_run - timedelta(microseconds=1))
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    db.add(db_rule)
+    db.commit()
+    db.refresh(db_rule)
+    return db_rule
+
+
+@router.get("/", response_model=Page[RecurringTaskResponse])
+async def list_recurring_tasks(
+    page: PageParams = Depends(),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    query = db.query(RecurringTask).filter(
+        RecurringTask.workspace_id == current_user.workspace_id,
+        RecurringTask.is_active == True,
+    )
+
+    if not current_user.is_admin:
+        query = query.filter(
+            (RecurringTask.created_by == current_user.id)
+            | (RecurringTask.assignee_id == current_user.id)
+        )
+
+    cache_key = (
+        "recurring_tasks",
+        current_user.workspace_id,
+        None if current_user.is_admin else current_user.id,
+    )
+    rules, next_cursor, total = page.page(db, query, RecurringTask.id, cache_key)
+    return {"items": rules, "next_cursor": next_cursor, "total": total}
+
+
+@router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_recurring_task(
+    rule_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    rule = (
+        db.query(RecurringTask)
+        .filter(
+            RecurringTask.id == rule_id,
+            RecurringTask.workspace_id == current_user.workspace_id,
+            RecurringTask.is_active == True,
+        )
+        .first()
+    )
+    if not rule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Recurring task not found"
+        )
+
+    if not current_user.is_admin and rule.created_by != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+        )
+
+    # Already materialized instances are regular tasks and are kept
+    rule.is_active = False
+    db.commit()
@@ -1,30 +1,129 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session, selectinload
+from typing import Any, Dict, List, Optional, Set
 from app.db.database import get_db
 from app.models.user import User
 from app.models.task import Task, TaskStatus, TaskPriority
-from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
+from app.schemas.pagination import Page
+from app.schemas.task import (
+    TaskCreate,
+    TaskResponse,
+    TaskSummary,
+    TaskUpdate,
+    TASK_FIELDS,
+    TASK_EXPANSIONS,
+    TASK_SORT_FIELDS,
+)
 from app.api.v1.auth import get_current_active_user
+from app.api.v1.pagination import PageParams
+from app.db.pagination import SortKey
+from app.services.user_lookup import user_lookup
 from uuid import UUID
 
 router = APIRouter()
 
+# List items are sparse TaskSummary objects: only the requested `fields`, plus
+# `assignee` (a UserResponse) when it is expanded
+SPARSE_TASK_PAGE_DESCRIPTION = (
+    "Page of TaskSummary objects limited to `fields`, with `assignee` when "
+    "`expand=assignee`"
+)
+
+
+def _split_csv(value: Optional[str]) -> Set[str]:
+    if not value:
+        return set()
+    return {item.strip() for item in value.split(",") if item.strip()}
+
+
+def parse_fields(
+    fields: Optional[str] = Query(
+        None, description="Comma-separated task fields to return, e.g. id,title,status"
+    ),
+) -> Optional[Set[str]]:
+    requested = _split_csv(fields)
+    unknown = requested - TASK_FIELDS
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown task field(s): {', '.join(sorted(unknown))}",
+        )
+    return requested or None
+
+
+def parse_expand(
+    expand: Optional[str] = Query(
+        None, description="Comma-separated relations to embed: assignee"
+    ),
+) -> Set[str]:
+    requested = _split_csv(expand)
+    unknown = requested - TASK_EXPANSIONS
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown expansion(s): {', '.join(sorted(unknown))}",
+        )
+    return requested
+
+
+def parse_sort(
+    sort: Optional[str] = Query(
+        None,
+        description="Comma-separated sort keys (due_date, priority, updated_at); "
+        "prefix with - for descending, e.g. due_date,-priority",
+    ),
+) -> List[SortKey]:
+    keys = []
+    seen = set()
+    for item in (sort or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        descending = item.startswith("-")
+        name = item[1:] if descending else item
+        if name not in TASK_SORT_FIELDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown sort field: {name}",
+            )
+        if name in seen:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Duplicate sort field: {name}",
+            )
+        seen.add(name)
+        keys.append(SortKey(getattr(Task, name), descending=descending))
+    return keys
+
+
+def serialize_tasks(
+    tasks: List[Task], fields: Optional[Set[str]], expand: Set[str]
+) -> List[dict]:
+    # Nested relations are only validated (and lazily loaded) when expanded
+    schema = TaskResponse if "assignee" in expand else TaskSummary
+    include = fields | expand if fields else None
+    return [
+        schema.model_validate(task).model_dump(mode="json", include=include)
+        for task in tasks
+    ]
+
 
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
-async def create_task(
+def create_task(
     task: TaskCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     if task.assignee_id:
-        assignee = db.query(User).filter(User.id == task.assignee_id).first()
-        if not assignee:
+        assignee = user_lookup.by_id(db, task.assignee_id)
+        if not assignee or assignee.workspace_id != current_user.workspace_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Assignee not found"
             )
 
     db_task = Task(
+        workspace_id=current_user.workspace_id,
         title=task.title,
         description=task.description,
         status=task.status,
@@ -39,18 +138,29 @@ async def create_task(
     return db_task
 
 
-@router.get("/", response_model=List[TaskResponse])
+@router.get(
+    "/",
+    response_model=Page[Dict[str, Any]],
+    response_description=SPARSE_TASK_PAGE_DESCRIPTION,
+)
 async def list_tasks(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(10, ge=1, le=100, description="Number of records to return"),
+    page: PageParams = Depends(),
     status: Optional[TaskStatus] = Query(None, description="Filter by status"),
     priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
     assignee_id: Optional[UUID] = Query(None, description="Filter by assignee"),
     search: Optional[str] = Query(None, description="Search by title or description"),
+    fields: Optional[Set[str]] = Depends(parse_fields),
+    expand: Set[str] = Depends(parse_expand),
+    sort: List[SortKey] = Depends(parse_sort),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    query = db.query(Task).filter(Task.is_active)
+    query = db.query(Task).filter(
+        Task.workspace_id == current_user.workspace_id, Task.is_active
+    )
+
+    if "assignee" in expand:
+        query = query.options(selectinload(Task.assignee))
 
     if not current_user.is_admin:
         query = query.filter(
@@ -71,12 +181,23 @@ async def list_tasks(
             (Task.title.ilike(f"%{search}%")) | (Task.description.ilike(f"%{search}%"))
         )
 
-    tasks = query.offset(skip).limit(limit).all()
-    if not tasks:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Tasks not found"
-        )
-    return tasks
+    cache_key = (
+        "tasks",
+        current_user.workspace_id,
+        None if current_user.is_admin else current_user.id,
+        status,
+        priority,
+        assignee_id,
+        search,
+    )
+    tasks, next_cursor, total = page.page(db, query, Task.id, cache_key, sort=sort)
+    return JSONResponse(
+        content={
+            "items": serialize_tasks(tasks, fields, expand),
+            "next_cursor": next_cursor,
+            "total": total,
+        }
+    )
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
@@ -85,7 +206,15 @@ async def get_task(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    task = db.query(Task).filter(Task.id == task_id, Task.is_active == True).first()
+    task = (
+        db.query(Task)
+        .filter(
+            Task.id == task_id,
+            Task.workspace_id == current_user.workspace_id,
+            Task.is_active == True,
+        )
+        .first()
+    )
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
@@ -104,13 +233,21 @@ async def get_task(
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
-async def update_task(
+def update_task(
     task_id: UUID,
     task_update: TaskUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    task = db.query(Task).filter(Task.id == task_id, Task.is_active == True).first()
+    task = (
+        db.query(Task)
+        .filter(
+            Task.id == task_id,
+            Task.workspace_id == current_user.workspace_id,
+            Task.is_active == True,
+        )
+        .first()
+    )
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
@@ -126,8 +263,8 @@ async def update_task(
         )
 
     if task_update.assignee_id and task_update.assignee_id != task.assignee_id:
-        assignee = db.query(User).filter(User.id == task_update.assignee_id).first()
-        if not assignee:
+        assignee = user_lookup.by_id(db, task_update.assignee_id)
+        if not assignee or assignee.workspace_id != current_user.workspace_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Assignee not found"
             )
@@ -147,7 +284,15 @@ async def delete_task(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    task = db.query(Task).filter(Task.id == task_id, Task.is_active == True).first()
+    task = (
+        db.query(Task)
+        .filter(
+            Task.id == task_id,
+            Task.workspace_id == current_user.workspace_id,
+            Task.is_active == True,
+        )
+        .first()
+    )
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
@@ -162,20 +307,38 @@ async def delete_task(
     db.commit()
 
 
-@router.get("/my/tasks", response_model=List[TaskResponse])
+@router.get(
+    "/my/tasks",
+    response_model=Page[Dict[str, Any]],
+    response_description=SPARSE_TASK_PAGE_DESCRIPTION,
+)
 async def get_my_tasks(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(10, ge=1, le=100, description="Number of records to return"),
+    page: PageParams = Depends(),
     status: Optional[TaskStatus] = Query(None, description="Filter by status"),
+    fields: Optional[Set[str]] = Depends(parse_fields),
+    expand: Set[str] = Depends(parse_expand),
+    sort: List[SortKey] = Depends(parse_sort),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     query = db.query(Task).filter(
-        Task.assignee_id == current_user.id, Task.is_active == True
+        Task.workspace_id == current_user.workspace_id,
+        Task.assignee_id == current_user.id,
+        Task.is_active == True,
     )
 
+    if "assignee" in expand:
+        query = query.options(selectinload(Task.assignee))
+
     if status:
         query = query.filter(Task.status == status)
 
-    tasks = query.offset(skip).limit(limit).all()
-    return tasks
+    cache_key = ("my_tasks", current_user.id, status)
+    tasks, next_cursor, total = page.page(db, query, Task.id, cache_key, sort=sort)
+    return JSONResponse(
+        content={
+            "items": serialize_tasks(tasks, fields, expand),
+            "next_cursor": next_cursor,
+            "total": total,
+        }
+    )
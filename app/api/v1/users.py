@@ -1,26 +1,36 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Optional
 import uuid
-from app.db.database import get_db
+from app.db.database import get_db, get_default_db
 from app.models.user import User
+from app.models.workspace import Workspace
+from app.schemas.pagination import Page
 from app.schemas.user import UserCreate, UserResponse, UserUpdate, AdminUserCreate
+from app.core.config import settings
 from app.core.security import get_password_hash
 from app.api.v1.auth import get_current_active_user, get_current_admin_user
+from app.api.v1.pagination import PageParams
+from app.services.user_lookup import user_lookup
 
 router = APIRouter()
 
 
 @router.post("/admin", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def create_admin_user(
+def create_admin_user(
     user: AdminUserCreate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_default_db),
 ):
     """
-    Create the first admin user. This endpoint can only be used when no admin users exist.
+    Create a workspace together with its first admin user. Unless
+    ALLOW_WORKSPACE_SIGNUP is set, this endpoint can only be used when no admin users exist.
+    New workspaces always live on the default shard; WORKSPACE_SHARDS moves them.
     """
     # Check if any admin user already exists
-    existing_admin = db.query(User).filter(User.is_admin == True).first()
+    existing_admin = (
+        not settings.ALLOW_WORKSPACE_SIGNUP
+        and db.query(User).filter(User.is_admin == True).first()
+    )
     if existing_admin:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -28,43 +38,43 @@ async def create_admin_user(
         )
 
     # Check if email or username already exists
-    db_user = (
-        db.query(User)
-        .filter((User.email == user.email) | (User.username == user.username))
-        .first()
-    )
-    if db_user:
+    if user_lookup.by_email(db, user.email) or user_lookup.by_username(
+        db, user.username
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email or username already registered",
         )
+    workspace = Workspace(name=user.workspace_name)
+    db.add(workspace)
+    db.flush()
+
     hashed_password = get_password_hash(user.password)
     db_user = User(
         email=user.email,
         username=user.username,
         full_name=user.full_name,
         hashed_password=hashed_password,
+        workspace_id=workspace.id,
         is_active=True,
         is_admin=True,  # Always create as admin
     )
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
+    user_lookup.prime(db, db_user)
     return db_user
 
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def create_user(
+def create_user(
     user: UserCreate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_admin_user),
+    current_user: User = Depends(get_current_admin_user),
 ):
-    db_user = (
-        db.query(User)
-        .filter((User.email == user.email) | (User.username == user.username))
-        .first()
-    )
-    if db_user:
+    if user_lookup.by_email(db, user.email) or user_lookup.by_username(
+        db, user.username
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email or username already registered",
@@ -76,24 +86,25 @@ async def create_user(
         username=user.username,
         full_name=user.full_name,
         hashed_password=hashed_password,
+        workspace_id=current_user.workspace_id,
         is_active=user.is_active,
         is_admin=False,
     )
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
+    user_lookup.prime(db, db_user)
     return db_user
 
 
-@router.get("/", response_model=List[UserResponse])
+@router.get("/", response_model=Page[UserResponse])
 async def list_users(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(10, ge=1, le=100, description="Number of records to return"),
+    page: PageParams = Depends(),
     search: Optional[str] = Query(None, description="Search by username or email"),
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user),
 ):
-    query = db.query(User)
+    query = db.query(User).filter(User.workspace_id == current_user.workspace_id)
 
     if search:
         query = query.filter(
@@ -102,8 +113,9 @@ async def list_users(
             | (User.full_name.ilike(f"%{search}%"))
         )
 
-    users = query.offset(skip).limit(limit).all()
-    return users
+    cache_key = ("users", current_user.workspace_id, search)
+    users, next_cursor, total = page.page(db, query, User.id, cache_key)
+    return {"items": users, "next_cursor": next_cursor, "total": total}
 
 
 @router.get("/me", response_model=UserResponse)
@@ -112,13 +124,13 @@ async def get_current_user_info(current_user: User = Depends(get_current_active_
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(
+def get_user(
     user_id: uuid.UUID,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user),
 ):
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    user = user_lookup.by_id(db, user_id)
+    if not user or user.workspace_id != current_user.workspace_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
@@ -126,7 +138,7 @@ async def get_user(
 
 
 @router.put("/{user_id}", response_model=UserResponse)
-async def update_user(
+def update_user(
     user_id: uuid.UUID,
     user_update: UserUpdate,
     db: Session = Depends(get_db),
@@ -137,12 +149,17 @@ async def update_user(
             status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = (
+        db.query(User)
+        .filter(User.id == user_id, User.workspace_id == current_user.workspace_id)
+        .first()
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
+    previous = UserResponse.model_validate(user)
     update_data = user_update.dict(exclude_unset=True)
     for field, value in update_data.items():
         if field == "is_admin" and not current_user.is_admin:
@@ -151,4 +168,8 @@ async def update_user(
 
     db.commit()
     db.refresh(user)
+    # Only after the commit: a lookup before it would re-cache the old row
+    # under the old username and email
+    user_lookup.invalidate(db, previous)
+    user_lookup.prime(db, user)
     return user
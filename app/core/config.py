@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
+from typing import Dict
 
 
 class Settings(BaseSettings):
@@ -12,6 +13,32 @@ class Settings(BaseSettings):
     ALGORITHM: str = Field(..., env="ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES: str = Field(..., env="ACCESS_TOKEN_EXPIRE_MINUTES")
 
+    # JSON objects: shard name -> database URL, workspace id -> shard name
+    DB_SHARDS: Dict[str, str] = Field({}, env="DB_SHARDS")
+    WORKSPACE_SHARDS: Dict[str, str] = Field({}, env="WORKSPACE_SHARDS")
+    ALLOW_WORKSPACE_SIGNUP: bool = Field(False, env="ALLOW_WORKSPACE_SIGNUP")
+
+    COMPRESSION_MINIMUM_SIZE: int = Field(1024, env="COMPRESSION_MINIMUM_SIZE")
+
+    COUNT_CACHE_SIZE: int = Field(10000, env="COUNT_CACHE_SIZE")
+    COUNT_CACHE_TTL_SECONDS: float = Field(60, env="COUNT_CACHE_TTL_SECONDS")
+    COUNT_EXACT_THRESHOLD: int = Field(10000, env="COUNT_EXACT_THRESHOLD")
+
+    USER_CACHE_SIZE: int = Field(10000, env="USER_CACHE_SIZE")
+    USER_CACHE_TTL_SECONDS: float = Field(300, env="USER_CACHE_TTL_SECONDS")
+    USER_CACHE_NEGATIVE_TTL_SECONDS: float = Field(
+        5, env="USER_CACHE_NEGATIVE_TTL_SECONDS"
+    )
+
+    SCHEDULER_INTERVAL_SECONDS: float = Field(30, env="SCHEDULER_INTERVAL_SECONDS")
+    SCHEDULER_BATCH_SIZE: int = Field(1000, env="SCHEDULER_BATCH_SIZE")
+    SCHEDULER_DUE_SOON_MINUTES: int = Field(60, env="SCHEDULER_DUE_SOON_MINUTES")
+    SCHEDULER_HORIZON_HOURS: int = Field(24, env="SCHEDULER_HORIZON_HOURS")
+    SCHEDULER_LOOKBACK_HOURS: int = Field(24, env="SCHEDULER_LOOKBACK_HOURS")
+    SCHEDULER_EDIT_OVERLAP_SECONDS: float = Field(
+        60, env="SCHEDULER_EDIT_OVERLAP_SECONDS"
+    )
+
     @property
     def database_url(self) -> str:
         return f"postgresql://{self.DB_USER}:{self.DB_PASS}@{self.DB_ENV}:5432/{self.DB_NAME}"
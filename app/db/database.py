@@ -1,16 +1,102 @@
+import threading
+from typing import Dict, Optional
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.functions import now
 from app.core.config import settings
+from app.core.security import verify_token
 
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+DEFAULT_SHARD = "default"
+
+
+class ShardRegistry:
+    """
+    One engine, and therefore one connection pool, per database shard.
+
+    Workspaces live on the default database unless WORKSPACE_SHARDS maps
+    them to one of the DB_SHARDS; engines are created on first use.
+    """
+
+    def __init__(self, urls: Dict[str, str], workspace_shards: Dict[str, str]):
+        self.urls = urls
+        self.workspace_shards = workspace_shards
+        self._sessionmakers: Dict[str, sessionmaker] = {}
+        self._lock = threading.Lock()
+
+    def shard_for(self, workspace_id: Optional[str]) -> str:
+        if workspace_id is None:
+            return DEFAULT_SHARD
+        return self.workspace_shards.get(str(workspace_id), DEFAULT_SHARD)
+
+    def sessionmaker(self, shard: str = DEFAULT_SHARD) -> sessionmaker:
+        factory = self._sessionmakers.get(shard)
+        if factory is None:
+            with self._lock:
+                factory = self._sessionmakers.get(shard)
+                if factory is None:
+                    factory = sessionmaker(
+                        autocommit=False,
+                        autoflush=False,
+                        bind=create_engine(self.urls[shard]),
+                        info={"shard": shard},
+                    )
+                    self._sessionmakers[shard] = factory
+        return factory
+
+    def engine(self, shard: str = DEFAULT_SHARD) -> Engine:
+        return self.sessionmaker(shard).kw["bind"]
+
+
+shards = ShardRegistry(
+    {**settings.DB_SHARDS, DEFAULT_SHARD: settings.database_url},
+    settings.WORKSPACE_SHARDS,
+)
+engine = shards.engine()
+SessionLocal = shards.sessionmaker()
 
 Base = declarative_base()
 
-def get_db():
+
+@compiles(now, "sqlite")
+def _compile_now_sqlite(element, compiler, **kw):
+    # SQLite compares datetimes as text, so database-side timestamps must use
+    # SQLAlchemy's storage format rather than CURRENT_TIMESTAMP's
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+def resolve_workspace(request: Request) -> Optional[str]:
+    """
+    Workspace of the request: the signed claim of a valid bearer token, else
+    the X-Workspace-ID header, which only unauthenticated calls such as login
+    can rely on.
+    """
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        payload = verify_token(token)
+        if payload:
+            return payload.get("ws")
+    return request.headers.get("X-Workspace-ID") or None
+
+
+def get_db(request: Request):
+    shard = DEFAULT_SHARD
+    if shards.workspace_shards:
+        shard = shards.shard_for(resolve_workspace(request))
+    db = shards.sessionmaker(shard)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_default_db():
+    """Session on the default shard, where new workspaces are created."""
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -0,0 +1,247 @@
+import base64
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+from sqlalchemy import Enum as SQLEnum, and_, case, or_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from app.core.cache import MISSING, TTLCache
+from app.core.config import settings
+from app.schemas.pagination import CountMode
+
+count_cache = TTLCache(
+    maxsize=settings.COUNT_CACHE_SIZE, ttl=settings.COUNT_CACHE_TTL_SECONDS
+)
+
+
+class Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def encode_cursor(values: List[Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """Raises ValueError for anything that was not produced by `encode_cursor`."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+class SortKey(NamedTuple):
+    column: Any
+    descending: bool = False
+
+    def __str__(self) -> str:
+        return ("-" if self.descending else "") + self.column.key
+
+
+def _sort_expression(column, dialect: str):
+    # PostgreSQL enums already sort in declaration order; elsewhere the stored
+    # text would sort alphabetically
+    if isinstance(column.type, SQLEnum) and dialect != "postgresql":
+        return case(
+            {member: rank for rank, member in enumerate(column.type.enum_class)},
+            value=column,
+        )
+    return column
+
+
+def _order_by(expression, descending: bool, nullable: bool):
+    # NULLs sort as the largest value either way, matching a plain
+    # PostgreSQL btree index scanned forwards or backwards
+    if descending:
+        expression = expression.desc()
+        return expression.nulls_first() if nullable else expression
+    expression = expression.asc()
+    return expression.nulls_last() if nullable else expression
+
+
+def _dump_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return None if value is None else str(value)
+
+
+def _load_value(column, value, dialect: str):
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ValueError("Invalid cursor")
+    if isinstance(column.type, SQLEnum):
+        member = column.type.enum_class(value)
+        if dialect == "postgresql":
+            return member
+        return list(column.type.enum_class).index(member)
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return python_type(value)
+
+
+def _after(keys, values) -> List[Any]:
+    """
+    Conditions for the rows strictly after `values` in the order of `keys`
+    (expression, descending, nullable), split into consecutive segments of
+    that order: every row matched by one condition sorts before the rows of
+    the next.
+    """
+    clauses = []
+    for index, ((expression, descending, nullable), value) in enumerate(zip(keys, values)):
+        if value is None:
+            beyond = expression.isnot(None) if descending else None
+        elif descending:
+            beyond = expression < value
+        else:
+            beyond = expression > value
+            if nullable:
+                beyond = or_(beyond, expression.is_(None))
+        if beyond is not None:
+            equal = [
+                previous.is_(None) if previous_value is None else previous == previous_value
+                for (previous, _, _), previous_value in zip(keys[:index], values[:index])
+            ]
+            clauses.append(and_(*equal, beyond))
+    condition = or_(*clauses)
+
+    # Each segment also bounds the leading key alone, which the planner can
+    # use as an index range instead of filtering from the start of the
+    # index. NULLs are not part of any range, so when the cursor is on one
+    # side of them and the order continues on the other, that side is a
+    # segment of its own.
+    expression, descending, nullable = keys[0]
+    value = values[0]
+    if value is None:
+        if descending:
+            return [and_(expression.is_(None), condition), expression.isnot(None)]
+        return [and_(expression.is_(None), condition)]
+    if descending:
+        return [and_(expression <= value, condition)]
+    if nullable:
+        return [and_(expression >= value, condition), expression.is_(None)]
+    return [and_(expression >= value, condition)]
+
+
+def _planner_estimate(db: Session, query: Query) -> int:
+    plan = db.execute(Explain(query.order_by(None).statement)).scalar()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_rows(
+    db: Session, query: Query, mode: CountMode, cache_key: Hashable
+) -> Optional[int]:
+    """
+    Total number of rows matched by `query`.
+
+    `estimated` serves a cached count for the same filters while it is fresh,
+    otherwise asks the PostgreSQL planner and only falls back to an exact
+    count when the estimate is small enough to be cheap to verify.
+    """
+    if mode == CountMode.none:
+        return None
+
+    if mode == CountMode.estimated:
+        total = count_cache.get(cache_key)
+        if total is not MISSING:
+            return total
+        if db.get_bind().dialect.name == "postgresql":
+            total = _planner_estimate(db, query)
+            if total >= settings.COUNT_EXACT_THRESHOLD:
+                count_cache.set(cache_key, total)
+                return total
+
+    total = query.order_by(None).count()
+    count_cache.set(cache_key, total)
+    return total
+
+
+def _spec(sort: Sequence[SortKey]) -> List[str]:
+    return [",".join(str(item) for item in sort)] if sort else []
+
+
+def parse_cursor(
+    after: List[Any], key, dialect: str, sort: Sequence[SortKey] = ()
+) -> List[Any]:
+    """
+    Bind values of a decoded cursor for `paginate`: the sort values followed
+    by the key. Raises ValueError when the cursor was not issued for this
+    order or its values do not fit the columns.
+    """
+    spec = _spec(sort)
+    # A cursor only continues the order it was issued for
+    if len(after) != len(spec) + len(sort) + 1 or after[:len(spec)] != spec:
+        raise ValueError("Invalid cursor")
+    columns = [item.column for item in sort] + [key]
+    values = [
+        _load_value(column, value, dialect)
+        for column, value in zip(columns, after[len(spec):])
+    ]
+    if values[-1] is None:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def paginate(
+    query: Query,
+    key,
+    limit: int,
+    after: Optional[List[Any]] = None,
+    skip: int = 0,
+    sort: Sequence[SortKey] = (),
+) -> Tuple[list, Optional[str]]:
+    """
+    Keyset page ordered by `sort` and then the unique column `key`, fetching
+    one extra row to tell whether a next page exists. `after` comes from
+    `parse_cursor`. With `sort` the next cursor holds the sort spec, the last
+    row's sort values and its key; without it, just the key. `skip` is only
+    honoured without a cursor.
+    """
+    dialect = query.session.get_bind().dialect.name
+    descending = sort[-1].descending if sort else False
+    keys = [
+        (_sort_expression(item.column, dialect), item.descending, item.column.nullable)
+        for item in sort
+    ]
+    keys.append((key, descending, False))
+    query = query.order_by(*(_order_by(*item) for item in keys))
+
+    if after:
+        segments = [query.filter(condition) for condition in _after(keys, after)]
+    else:
+        segments = [query.offset(skip) if skip else query]
+
+    # Later segments are only read once the earlier ones run out
+    rows = []
+    for segment in segments:
+        rows.extend(segment.limit(limit + 1 - len(rows)).all())
+        if len(rows) > limit:
+            break
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            _spec(sort)
+            + [_dump_value(getattr(last, item.column.key)) for item in sort]
+            + [str(getattr(last, key.key))]
+        )
+    return rows, next_cursor
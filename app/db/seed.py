@@ -0,0 +1,379 @@
+"""
+Bulk-generate workspaces, users and tasks for local and performance testing.
+
+    python -m app.db.seed --users 100000 --tasks 10000000 --seed 42
+    python -m app.db.seed --sqlite seed.db --users 1000 --tasks 100000
+
+Against PostgreSQL (the configured database, schema already migrated) rows
+are streamed with COPY; with --sqlite the schema is created in the given
+file and rows are inserted with executemany. Every user shares one bcrypt
+hash of --password, computed once.
+
+Timestamps are spread over the year before --now. With --seed, --now
+defaults to a fixed date so the same seed always produces the same rows;
+without --seed a random seed and the current time are used, and printed so
+the run can be repeated.
+"""
+import argparse
+import bisect
+import io
+import itertools
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from app.core.security import get_password_hash
+from app.db.database import Base, engine as default_engine
+from app.models.workspace import Workspace  # noqa: F401
+from app.models.user import User  # noqa: F401
+from app.models.task import Task  # noqa: F401
+from app.models.recurring_task import RecurringTask  # noqa: F401
+
+WORKSPACE_COLUMNS = ("id", "name", "created_at")
+USER_COLUMNS = (
+    "id", "workspace_id", "email", "username", "hashed_password", "full_name",
+    "is_active", "is_admin", "created_at", "updated_at",
+)
+TASK_COLUMNS = (
+    "id", "workspace_id", "title", "description", "status", "priority",
+    "assignee_id", "created_by", "is_active", "due_date", "created_at", "updated_at",
+)
+
+STATUSES = (("pending", 35), ("in_progress", 25), ("completed", 35), ("cancelled", 5))
+PRIORITIES = (("low", 30), ("medium", 45), ("high", 20), ("urgent", 5))
+UNASSIGNED_RATE = 0.15
+NO_DUE_DATE_RATE = 0.2
+INACTIVE_TASK_RATE = 0.03
+INACTIVE_USER_RATE = 0.05
+HISTORY_DAYS = 365
+SEED_ANCHOR = datetime(2025, 1, 1, tzinfo=timezone.utc)
+SEEDED_TABLES = ("workspaces", "users", "tasks")
+
+VERBS = ("Review", "Update", "Fix", "Write", "Plan", "Test", "Deploy", "Prepare", "Refactor", "Document")
+NOUNS = ("report", "invoice", "release", "onboarding", "roadmap", "budget", "migration", "dashboard", "contract", "backlog")
+WORDS = ("lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit", "sed", "do", "eiusmod", "tempor")
+FIRST_NAMES = ("Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn")
+LAST_NAMES = ("Smith", "Patel", "Garcia", "Kim", "Nguyen", "Müller", "Rossi", "Silva", "Khan", "Cohen")
+
+Row = Tuple
+
+
+@compiles(UUID, "sqlite")
+def _compile_uuid_sqlite(type_, compiler, **kw):
+    # SQLAlchemy stores non-native UUIDs as 32 hex characters
+    return "CHAR(32)"
+
+
+class Generator:
+    """Deterministic rows for a given seed; values are already encoded for the target database."""
+
+    def __init__(self, seed: int, sqlite: bool, now: datetime):
+        self.rnd = random.Random(seed)
+        self.sqlite = sqlite
+        self.now = int(now.timestamp())
+        self.statuses, self.status_weights = self._cumulative(STATUSES)
+        self.priorities, self.priority_weights = self._cumulative(PRIORITIES)
+        self.descriptions = [" ".join(self.rnd.choices(WORDS, k=8)) for _ in range(1000)]
+        self._days = {}
+
+    @staticmethod
+    def _cumulative(weighted):
+        values, total, cumulative = [], 0, []
+        for value, weight in weighted:
+            total += weight
+            values.append(value)
+            cumulative.append(total)
+        return values, cumulative
+
+    def pick(self, values, cumulative):
+        return values[bisect.bisect(cumulative, self.rnd.random() * cumulative[-1])]
+
+    def uuid(self) -> str:
+        # Both SQLAlchemy's SQLite storage and PostgreSQL's uuid input accept plain hex
+        return uuid.UUID(int=self.rnd.getrandbits(128), version=4).hex
+
+    def bool(self, value: bool):
+        return int(value) if self.sqlite else ("t" if value else "f")
+
+    def timestamp(self, epoch: int) -> str:
+        """UTC timestamp text; datetime.strftime is too slow for millions of rows."""
+        day, seconds = divmod(epoch, 86400)
+        date = self._days.get(day)
+        if date is None:
+            date = self._days[day] = datetime.fromtimestamp(
+                day * 86400, timezone.utc
+            ).strftime("%Y-%m-%d")
+        hours, seconds = divmod(seconds, 3600)
+        minutes, seconds = divmod(seconds, 60)
+        # SQLAlchemy stores SQLite datetimes with microseconds and compares them as text
+        suffix = ".000000" if self.sqlite else "+00"
+        return f"{date} {hours:02d}:{minutes:02d}:{seconds:02d}{suffix}"
+
+    def past(self, days: int = HISTORY_DAYS) -> int:
+        return self.now - int(self.rnd.random() * days * 86400)
+
+    def workspaces(self, count: int) -> List[Row]:
+        return [
+            (self.uuid(), f"Workspace {i}", self.timestamp(self.past()))
+            for i in range(count)
+        ]
+
+    def users(self, count: int, workspace_ids: Sequence[str], password_hash: str) -> List[Row]:
+        rows = []
+        rnd = self.rnd
+        for i in range(count):
+            created = self.timestamp(self.past())
+            rows.append((
+                self.uuid(),
+                workspace_ids[i % len(workspace_ids)],
+                f"user{i}@example.com",
+                f"user{i}",
+                password_hash,
+                f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)}",
+                self.bool(rnd.random() >= INACTIVE_USER_RATE),
+                # The first user of each workspace is its admin
+                self.bool(i < len(workspace_ids)),
+                created,
+                created,
+            ))
+        return rows
+
+    def tasks(
+        self, count: int, members: Sequence[Sequence[str]], workspace_ids: Sequence[str]
+    ) -> Iterator[Row]:
+        """`members[w]` lists the user ids of `workspace_ids[w]`."""
+        rnd = self.rnd
+        pick = self.pick
+        timestamp = self.timestamp
+        null = None if self.sqlite else "\\N"
+        # Work piles up on a few people: assignee rank r is picked with weight 1/(r+1)
+        assignee_weights = {}
+        for users in members:
+            if len(users) not in assignee_weights:
+                assignee_weights[len(users)] = list(
+                    itertools.accumulate(1 / (rank + 1) for rank in range(len(users)))
+                )
+        history = HISTORY_DAYS * 86400
+        active, inactive = self.bool(True), self.bool(False)
+
+        for i in range(count):
+            w = int(rnd.random() * len(workspace_ids))
+            users = members[w]
+            created = self.now - int(rnd.random() * history)
+            updated = created + int((self.now - created) * rnd.random())
+            due = null
+            if rnd.random() >= NO_DUE_DATE_RATE:
+                due = timestamp(created + int(rnd.triangular(1, 60, 7) * 86400))
+            assignee = null
+            if rnd.random() >= UNASSIGNED_RATE:
+                assignee = pick(users, assignee_weights[len(users)])
+            yield (
+                self.uuid(),
+                workspace_ids[w],
+                f"{VERBS[int(rnd.random() * len(VERBS))]} {NOUNS[int(rnd.random() * len(NOUNS))]} #{i}",
+                self.descriptions[int(rnd.random() * len(self.descriptions))],
+                pick(self.statuses, self.status_weights),
+                pick(self.priorities, self.priority_weights),
+                assignee,
+                users[0] if rnd.random() < 0.5 else users[int(rnd.random() * len(users))],
+                active if rnd.random() >= INACTIVE_TASK_RATE else inactive,
+                due,
+                timestamp(created),
+                timestamp(updated),
+            )
+
+
+def _batches(rows, size: int) -> Iterator[List[Row]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _copy(engine: Engine, table: str, columns: Sequence[str], rows, batch_size: int) -> int:
+    copied = 0
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    connection = engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            for batch in _batches(rows, batch_size):
+                buffer = io.StringIO()
+                buffer.writelines("\t".join(row) + "\n" for row in batch)
+                buffer.seek(0)
+                cursor.copy_expert(sql, buffer)
+                copied += len(batch)
+        connection.commit()
+    finally:
+        connection.close()
+    return copied
+
+
+def _insert(engine: Engine, table: str, columns: Sequence[str], rows, batch_size: int) -> int:
+    inserted = 0
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        # A throwaway seed database does not need crash safety
+        cursor.execute("PRAGMA synchronous = OFF")
+        cursor.execute("PRAGMA journal_mode = MEMORY")
+        for batch in _batches(rows, batch_size):
+            cursor.executemany(sql, batch)
+            inserted += len(batch)
+        connection.commit()
+    finally:
+        connection.close()
+    return inserted
+
+
+def _truncate(engine: Engine) -> None:
+    with engine.begin() as connection:
+        if engine.dialect.name == "postgresql":
+            connection.exec_driver_sql(
+                "TRUNCATE tasks, recurring_tasks, users, workspaces CASCADE"
+            )
+        else:
+            for table in ("tasks", "recurring_tasks", "users", "workspaces"):
+                connection.exec_driver_sql(f"DELETE FROM {table}")
+
+
+def _is_empty(engine: Engine, table: str) -> bool:
+    with engine.connect() as connection:
+        return connection.exec_driver_sql(f"SELECT 1 FROM {table} LIMIT 1").first() is None
+
+
+def _timestamp(value: str) -> datetime:
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an ISO 8601 timestamp: {value}")
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def _positive(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def seed(
+    engine: Engine,
+    workspaces: int,
+    users: int,
+    tasks: int,
+    seed: int = 42,
+    password: str = "password123",
+    batch_size: int = 100_000,
+    truncate: bool = False,
+    now: Optional[datetime] = None,
+) -> None:
+    """Load generated rows; `now` (default SEED_ANCHOR) is the end of their history."""
+    sqlite = engine.dialect.name == "sqlite"
+    if sqlite:
+        Base.metadata.create_all(engine)
+    if truncate:
+        _truncate(engine)
+    else:
+        # Generated ids, usernames and emails would collide with an earlier run
+        filled = [table for table in SEEDED_TABLES if not _is_empty(engine, table)]
+        if filled:
+            raise SystemExit(
+                f"{', '.join(filled)} already contain rows; "
+                "pass --truncate to replace them"
+            )
+
+    load = _insert if sqlite else _copy
+    generator = Generator(seed, sqlite, now or SEED_ANCHOR)
+    users = max(users, workspaces)
+
+    started = time.perf_counter()
+    workspace_rows = generator.workspaces(workspaces)
+    load(engine, "workspaces", WORKSPACE_COLUMNS, workspace_rows, batch_size)
+
+    workspace_ids = [row[0] for row in workspace_rows]
+    user_rows = generator.users(users, workspace_ids, get_password_hash(password))
+    load(engine, "users", USER_COLUMNS, user_rows, batch_size)
+    print(f"{workspaces} workspaces, {users} users in {time.perf_counter() - started:.1f}s")
+
+    # Admins come first in each workspace so they double as the usual creator
+    members = [[] for _ in workspace_ids]
+    for index, row in enumerate(user_rows):
+        members[index % workspaces].append(row[0])
+
+    # tasks is empty here, so building its secondary indexes once after the
+    # load is much cheaper than maintaining them row by row
+    indexes = list(Task.__table__.indexes)
+    for index in indexes:
+        index.drop(engine, checkfirst=True)
+
+    started = time.perf_counter()
+    try:
+        loaded = load(
+            engine, "tasks", TASK_COLUMNS,
+            generator.tasks(tasks, members, workspace_ids), batch_size,
+        )
+        elapsed = time.perf_counter() - started
+        print(f"{loaded} tasks in {elapsed:.1f}s ({loaded / max(elapsed, 1e-9):,.0f} rows/s)")
+    finally:
+        # Also after a failed or interrupted load, so the database is never
+        # left without its task indexes
+        started = time.perf_counter()
+        for index in indexes:
+            index.create(engine, checkfirst=True)
+        if indexes:
+            print(f"{len(indexes)} task indexes rebuilt in {time.perf_counter() - started:.1f}s")
+
+    # Fresh statistics keep planner row estimates (count=estimated) accurate
+    with engine.begin() as connection:
+        connection.exec_driver_sql("ANALYZE")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed the database with generated data")
+    parser.add_argument("--workspaces", type=_positive, default=1)
+    parser.add_argument("--users", type=_positive, default=100)
+    parser.add_argument("--tasks", type=_positive, default=10_000)
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible data (default: random)")
+    parser.add_argument(
+        "--now", type=_timestamp,
+        help=f"End of the generated history (default: {SEED_ANCHOR.isoformat()} "
+        "with --seed, otherwise the current time)",
+    )
+    parser.add_argument("--password", default="password123", help="Password of every generated user")
+    parser.add_argument("--batch-size", type=_positive, default=100_000)
+    parser.add_argument("--sqlite", metavar="PATH", help="Seed a SQLite file instead of the configured database")
+    parser.add_argument("--truncate", action="store_true", help="Delete existing workspaces, users and tasks first")
+    args = parser.parse_args()
+
+    now = args.now
+    if args.seed is None:
+        args.seed = random.randrange(2**32)
+        now = now or datetime.now(timezone.utc)
+        print(f"--seed {args.seed} --now {now.isoformat()}")
+
+    engine = create_engine(f"sqlite:///{args.sqlite}") if args.sqlite else default_engine
+    seed(
+        engine,
+        workspaces=args.workspaces,
+        users=args.users,
+        tasks=args.tasks,
+        seed=args.seed,
+        password=args.password,
+        batch_size=args.batch_size,
+        truncate=args.truncate,
+        now=now,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.v1 import users, tasks, auth
-from app.core.config import settings # noqa: F401
+from brotli_asgi import BrotliMiddleware
+from app.api.v1 import users, tasks, auth, recurring_tasks
+from app.core.config import settings
 
 app = FastAPI(
     title="Task Management System API",
@@ -17,9 +18,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Brotli when the client accepts it, gzip otherwise; small bodies are sent as-is
+app.add_middleware(
+    BrotliMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_fallback=True,
+)
+
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["authentication"])
 app.include_router(users.router, prefix="/api/v1/users", tags=["users"])
 app.include_router(tasks.router, prefix="/api/v1/tasks", tags=["tasks"])
+app.include_router(
+    recurring_tasks.router,
+    prefix="/api/v1/recurring-tasks",
+    tags=["recurring tasks"],
+)
 
 @app.get("/")
 async def root():
@@ -0,0 +1,76 @@
+from sqlalchemy import (
+    String,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Index,
+    Enum as SQLEnum,
+)
+from datetime import datetime
+from sqlalchemy.sql import func, text
+from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.database import Base
+from app.models.task import TaskPriority
+from enum import Enum
+from typing import Optional
+import uuid
+
+
+class RecurrenceFrequency(str, Enum):
+    daily = "daily"
+    weekly = "weekly"
+    cron = "cron"
+
+
+class RecurringTask(Base):
+    __tablename__ = "recurring_tasks"
+    __table_args__ = (
+        Index("ix_recurring_tasks_workspace_id_id", "workspace_id", "id"),
+        Index(
+            "ix_recurring_tasks_next_run_at",
+            "next_run_at",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    workspace_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False
+    )
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    priority: Mapped[Enum] = mapped_column(
+        SQLEnum(TaskPriority), default=TaskPriority.medium
+    )
+    assignee_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
+    )
+    created_by: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
+    )
+    frequency: Mapped[Enum] = mapped_column(
+        SQLEnum(RecurrenceFrequency), nullable=False
+    )
+    interval: Mapped[int] = mapped_column(Integer, default=1)
+    # Comma-separated ISO weekdays for weekly rules, Monday=0
+    weekdays: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    cron_expression: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    start_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    next_run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    assignee = relationship("User", foreign_keys=[assignee_id])
+    creator = relationship("User", foreign_keys=[created_by])
@@ -3,10 +3,12 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
+    UniqueConstraint,
     Enum as SQLEnum,
 )
 from datetime import datetime
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.database import Base
@@ -28,12 +30,50 @@ class TaskPriority(str, Enum):
     urgent = "urgent"
 
 
+# Tasks the scheduler still has to remind about
+OPEN_TASK_PREDICATE = "is_active AND status NOT IN ('completed', 'cancelled')"
+
+
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_workspace_id_id", "workspace_id", "id"),
+        Index("ix_tasks_workspace_id_assignee_id", "workspace_id", "assignee_id", "id"),
+        Index("ix_tasks_workspace_id_created_by", "workspace_id", "created_by", "id"),
+        # Sort orders offered by the task list endpoints
+        Index("ix_tasks_workspace_id_due_date", "workspace_id", "due_date", "id"),
+        Index("ix_tasks_workspace_id_priority", "workspace_id", "priority", "id"),
+        Index("ix_tasks_workspace_id_updated_at", "workspace_id", "updated_at", "id"),
+        Index(
+            "ix_tasks_workspace_id_assignee_id_due_date",
+            "workspace_id", "assignee_id", "due_date", "id",
+        ),
+        Index(
+            "ix_tasks_workspace_id_assignee_id_priority",
+            "workspace_id", "assignee_id", "priority", "id",
+        ),
+        Index(
+            "ix_tasks_workspace_id_assignee_id_updated_at",
+            "workspace_id", "assignee_id", "updated_at", "id",
+        ),
+        Index(
+            "ix_tasks_due_open",
+            "due_date",
+            "id",
+            postgresql_where=text(OPEN_TASK_PREDICATE),
+            sqlite_where=text(OPEN_TASK_PREDICATE),
+        ),
+        UniqueConstraint(
+            "recurring_task_id", "due_date", name="uq_tasks_recurring_occurrence"
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
+    workspace_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("workspaces.id"), nullable=False
+    )
     title: Mapped[str] = mapped_column(String, nullable=False, index=True)
     description: Mapped[str] = mapped_column(String)
     status: Mapped[Enum] = mapped_column(
@@ -48,8 +88,18 @@ class Task(Base):
     created_by: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
     )
+    recurring_task_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("recurring_tasks.id"), nullable=True
+    )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     due_date: Mapped[Enum] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Due date each scheduler reminder was last sent for
+    due_soon_reminder_for: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    overdue_reminder_for: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
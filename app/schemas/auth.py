@@ -9,6 +9,7 @@ class Token(BaseModel):
     user_id: UUID
     username: str
     is_admin: bool
+    workspace_id: UUID
 
 
 class TokenData(BaseModel):
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+from enum import Enum
+
+T = TypeVar("T")
+
+
+class CountMode(str, Enum):
+    exact = "exact"
+    estimated = "estimated"
+    none = "none"
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
@@ -0,0 +1,67 @@
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import List, Optional
+from datetime import datetime
+from app.models.recurring_task import RecurrenceFrequency
+from app.models.task import TaskPriority
+from app.services.recurrence import CronExpression, parse_weekdays
+from uuid import UUID
+
+class RecurringTaskCreate(BaseModel):
+    title: str
+    description: Optional[str] = None
+    priority: TaskPriority = TaskPriority.medium
+    assignee_id: Optional[UUID] = None
+    frequency: RecurrenceFrequency
+    interval: int = Field(1, ge=1, description="Repeat every N days or weeks")
+    weekdays: Optional[List[int]] = Field(
+        None, description="Weekly rules only: ISO weekdays with Monday=0"
+    )
+    cron_expression: Optional[str] = Field(
+        None, description="Cron rules only: five-field expression in UTC"
+    )
+    start_at: datetime
+
+    @field_validator("weekdays")
+    @classmethod
+    def check_weekdays(cls, value):
+        if value is not None and any(day < 0 or day > 6 for day in value):
+            raise ValueError("weekdays must be between 0 (Monday) and 6 (Sunday)")
+        return value
+
+    @model_validator(mode="after")
+    def check_rule(self):
+        if self.frequency == RecurrenceFrequency.cron:
+            if not self.cron_expression:
+                raise ValueError("cron_expression is required for cron rules")
+            CronExpression(self.cron_expression)
+        elif self.cron_expression:
+            raise ValueError("cron_expression is only allowed for cron rules")
+        if self.weekdays and self.frequency != RecurrenceFrequency.weekly:
+            raise ValueError("weekdays are only allowed for weekly rules")
+        return self
+
+class RecurringTaskResponse(BaseModel):
+    id: UUID
+    workspace_id: UUID
+    title: str
+    description: Optional[str] = None
+    priority: TaskPriority
+    assignee_id: Optional[UUID] = None
+    created_by: UUID
+    frequency: RecurrenceFrequency
+    interval: int
+    weekdays: List[int] = []
+    cron_expression: Optional[str] = None
+    start_at: datetime
+    next_run_at: datetime
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @field_validator("weekdays", mode="before")
+    @classmethod
+    def split_weekdays(cls, value):
+        return parse_weekdays(value) if isinstance(value, str) or value is None else value
+
+    class Config:
+        from_attributes = True
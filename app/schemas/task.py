@@ -24,13 +24,22 @@ class TaskUpdate(BaseModel):
     assignee_id: Optional[UUID] = None
     due_date: Optional[datetime] = None
 
-class TaskResponse(TaskBase):
+class TaskSummary(TaskBase):
     id: UUID
+    workspace_id: UUID
     created_by: UUID
+    recurring_task_id: Optional[UUID] = None
     is_active: bool
     created_at: datetime
     updated_at: datetime
-    assignee: Optional[UserResponse] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class TaskResponse(TaskSummary):
+    assignee: Optional[UserResponse] = None
+
+# Fields selectable through `fields=` and relations opt-in through `expand=`
+TASK_FIELDS = frozenset(TaskSummary.model_fields)
+TASK_EXPANSIONS = frozenset({"assignee"})
+TASK_SORT_FIELDS = frozenset({"due_date", "priority", "updated_at"})
\ No newline at end of file
@@ -20,6 +20,7 @@ class AdminUserCreate(BaseModel):
     username: str
     password: str = Field(..., min_length=8, max_length=72)
     full_name: Optional[str] = None
+    workspace_name: str = "Default"
 
 
 class UserUpdate(BaseModel):
@@ -32,6 +33,7 @@ class UserUpdate(BaseModel):
 
 class UserResponse(UserBase):
     id: uuid.UUID
+    workspace_id: uuid.UUID
     created_at: datetime
     updated_at: datetime
     is_admin: bool
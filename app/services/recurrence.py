@@ -0,0 +1,143 @@
+from datetime import datetime, timedelta, timezone
+from typing import FrozenSet, Iterable, List, Optional
+from app.models.recurring_task import RecurrenceFrequency
+
+# Cron matching gives up after this long without a match (e.g. "0 0 31 2 *")
+_CRON_SEARCH_LIMIT = timedelta(days=366 * 5)
+
+
+def as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def parse_weekdays(value: Optional[str]) -> List[int]:
+    if not value:
+        return []
+    return sorted({int(day) for day in value.split(",") if day.strip()})
+
+
+def format_weekdays(days: Iterable[int]) -> str:
+    return ",".join(str(day) for day in sorted(set(days)))
+
+
+class CronExpression:
+    """
+    Standard five-field cron expression (minute hour day-of-month month
+    day-of-week), evaluated in UTC. Supports `*`, lists, ranges and steps;
+    day-of-week uses 0 or 7 for Sunday.
+    """
+
+    def __init__(self, expression: str):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError("Cron expression must have 5 fields")
+        self.expression = expression
+        self.minutes = self._parse(parts[0], 0, 59)
+        self.hours = self._parse(parts[1], 0, 23)
+        self.days = self._parse(parts[2], 1, 31)
+        self.months = self._parse(parts[3], 1, 12)
+        self.weekdays = frozenset(day % 7 for day in self._parse(parts[4], 0, 7))
+        self._any_day = parts[2] == "*"
+        self._any_weekday = parts[4] == "*"
+
+    @staticmethod
+    def _parse(field: str, low: int, high: int) -> FrozenSet[int]:
+        values = set()
+        for part in field.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+                if step < 1:
+                    raise ValueError(f"Invalid cron step: {field}")
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start_text, end_text = part.split("-", 1)
+                start, end = int(start_text), int(end_text)
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+            if not low <= start <= end <= high:
+                raise ValueError(f"Cron field out of range: {field}")
+            values.update(range(start, end + 1, step))
+        return frozenset(values)
+
+    def _day_matches(self, value: datetime) -> bool:
+        day_ok = value.day in self.days
+        weekday_ok = (value.weekday() + 1) % 7 in self.weekdays
+        # Like cron, a restricted day-of-month and day-of-week match on either
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        value = as_utc(after).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = value + _CRON_SEARCH_LIMIT
+        while value <= limit:
+            if value.month not in self.months:
+                month_start = value.replace(day=1, hour=0, minute=0)
+                value = (month_start + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(value):
+                value = value.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if value.hour not in self.hours:
+                value = value.replace(minute=0) + timedelta(hours=1)
+                continue
+            minute = next((m for m in sorted(self.minutes) if m >= value.minute), None)
+            if minute is None:
+                value = value.replace(minute=0) + timedelta(hours=1)
+                continue
+            return value.replace(minute=minute)
+        raise ValueError(f"Cron expression never matches: {self.expression}")
+
+
+def next_occurrence(
+    frequency: RecurrenceFrequency,
+    start_at: datetime,
+    after: datetime,
+    interval: int = 1,
+    weekdays: Optional[List[int]] = None,
+    cron_expression: Optional[str] = None,
+) -> datetime:
+    """First occurrence of the rule strictly after `after`, never before `start_at`."""
+    start_at = as_utc(start_at)
+    after = as_utc(after)
+
+    if frequency == RecurrenceFrequency.cron:
+        return CronExpression(cron_expression).next_after(
+            max(after, start_at - timedelta(minutes=1))
+        )
+
+    if frequency == RecurrenceFrequency.daily:
+        if after < start_at:
+            return start_at
+        period = timedelta(days=interval)
+        return start_at + period * ((after - start_at) // period + 1)
+
+    # Weekly: every `interval` weeks counted from the week containing start_at
+    days = weekdays or [start_at.weekday()]
+    week_zero = start_at - timedelta(days=start_at.weekday())
+    period = timedelta(weeks=interval)
+    week = max(0, (after - week_zero) // period)
+    while True:
+        week_start = week_zero + period * week
+        for day in days:
+            candidate = week_start + timedelta(days=day)
+            if candidate >= start_at and candidate > after:
+                return candidate
+        week += 1
+
+
+def next_run(rule, after: datetime) -> datetime:
+    return next_occurrence(
+        rule.frequency,
+        rule.start_at,
+        after,
+        interval=rule.interval or 1,
+        weekdays=parse_weekdays(rule.weekdays),
+        cron_expression=rule.cron_expression,
+    )
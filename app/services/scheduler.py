@@ -0,0 +1,279 @@
+import heapq
+import itertools
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy import and_, case, or_, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.database import DEFAULT_SHARD, SessionLocal, shards
+from app.models.recurring_task import RecurringTask
+from app.models.task import Task, TaskStatus
+from app.services.recurrence import as_utc, next_run
+
+logger = logging.getLogger(__name__)
+
+DUE_SOON = "due_soon"
+OVERDUE = "overdue"
+CLOSED_STATUSES = (TaskStatus.completed, TaskStatus.cancelled)
+
+ReminderHandler = Callable[[str, List[Task]], None]
+
+
+def log_reminders(kind: str, tasks: List[Task]) -> None:
+    for task in tasks:
+        logger.info("%s: task %s due %s", kind, task.id, task.due_date)
+
+
+def _open_task_criteria():
+    return (
+        Task.is_active == True,
+        Task.status.notin_(CLOSED_STATUSES),
+        Task.due_date.isnot(None),
+    )
+
+
+def open_tasks(db: Session):
+    """Tasks matching the `ix_tasks_due_open` partial index predicate."""
+    return db.query(Task).filter(*_open_task_criteria())
+
+
+class Scheduler:
+    """
+    Materializes recurring tasks and fires due-soon/overdue reminders.
+
+    Each cycle only reads tasks whose due date entered the lookahead window
+    since the previous cycle (plus tasks edited since then), so its cost
+    follows the number of upcoming deadlines rather than the table size.
+    Upcoming reminders are kept in a min-heap ordered by fire time, and the
+    due date each task was scheduled for is remembered until it falls out
+    of the lookback window, so a task only gets new reminders when its due
+    date moves. Sent reminders are recorded on the task itself, which keeps
+    them from repeating across restarts and between scheduler processes.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        handler: ReminderHandler = log_reminders,
+        batch_size: int = settings.SCHEDULER_BATCH_SIZE,
+        due_soon: timedelta = timedelta(minutes=settings.SCHEDULER_DUE_SOON_MINUTES),
+        horizon: timedelta = timedelta(hours=settings.SCHEDULER_HORIZON_HOURS),
+        lookback: timedelta = timedelta(hours=settings.SCHEDULER_LOOKBACK_HOURS),
+        edit_overlap: timedelta = timedelta(
+            seconds=settings.SCHEDULER_EDIT_OVERLAP_SECONDS
+        ),
+    ):
+        self.session_factory = session_factory
+        self.handler = handler
+        self.batch_size = batch_size
+        self.due_soon = due_soon
+        self.horizon = horizon
+        self.lookback = lookback
+        self.edit_overlap = edit_overlap
+        self._heap: List[Tuple[datetime, int, str, object]] = []
+        self._sequence = itertools.count()
+        # task id -> due date its reminders were scheduled for, kept after
+        # they fire
+        self._scheduled: Dict[object, datetime] = {}
+        self._scanned_until: Optional[datetime] = None
+        self._last_scan: Optional[datetime] = None
+
+    def run_once(self, now: Optional[datetime] = None) -> None:
+        now = as_utc(now or datetime.now(timezone.utc))
+        db = self.session_factory()
+        try:
+            self.materialize(db, now)
+            self.scan(db, now)
+            self.fire(db, now)
+        finally:
+            db.close()
+
+    def run_forever(self, interval: float = settings.SCHEDULER_INTERVAL_SECONDS) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Scheduler cycle failed")
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    def materialize(self, db: Session, now: datetime) -> int:
+        """Create task instances for every occurrence up to `now + horizon`."""
+        until = now + self.horizon
+        created = 0
+        while True:
+            query = (
+                db.query(RecurringTask)
+                .filter(RecurringTask.is_active == True, RecurringTask.next_run_at <= until)
+                .order_by(RecurringTask.next_run_at)
+                .limit(self.batch_size)
+            )
+            if db.get_bind().dialect.name == "postgresql":
+                query = query.with_for_update(skip_locked=True)
+            rules = query.all()
+            if not rules:
+                return created
+
+            for rule in rules:
+                occurrence = as_utc(rule.next_run_at)
+                while occurrence <= until:
+                    db.add(
+                        Task(
+                            workspace_id=rule.workspace_id,
+                            title=rule.title,
+                            description=rule.description or "",
+                            priority=rule.priority,
+                            assignee_id=rule.assignee_id,
+                            created_by=rule.created_by,
+                            due_date=occurrence,
+                            recurring_task_id=rule.id,
+                        )
+                    )
+                    created += 1
+                    occurrence = next_run(rule, occurrence)
+                rule.next_run_at = occurrence
+            db.commit()
+
+    def scan(self, db: Session, now: datetime) -> int:
+        """Push reminders for open tasks due before `now + horizon` onto the heap."""
+        until = now + self.horizon
+        since = self._scanned_until or now - self.lookback
+        self._forget(now - self.lookback)
+        window = and_(Task.due_date > since, Task.due_date <= until)
+        if self._last_scan is not None:
+            # Tasks edited since the last cycle may have moved into an already
+            # scanned part of the window. updated_at comes from the database
+            # clock (the transaction start on PostgreSQL), so look back a
+            # little further than the previous cycle; rescheduling is
+            # idempotent
+            window = or_(
+                window,
+                and_(
+                    Task.updated_at >= self._last_scan - self.edit_overlap,
+                    Task.due_date > now - self.lookback,
+                    Task.due_date <= until,
+                ),
+            )
+        query = open_tasks(db).filter(window)
+
+        scheduled = 0
+        last = None
+        while True:
+            batch = query.order_by(Task.due_date, Task.id)
+            if last is not None:
+                last_id, last_due = last
+                batch = batch.filter(
+                    or_(
+                        Task.due_date > last_due,
+                        and_(Task.due_date == last_due, Task.id > last_id),
+                    )
+                )
+            rows = (
+                batch.with_entities(Task.id, Task.due_date).limit(self.batch_size).all()
+            )
+            for task_id, due_date in rows:
+                scheduled += self._schedule(task_id, as_utc(due_date), now)
+            if len(rows) < self.batch_size:
+                break
+            last = rows[-1]
+
+        self._scanned_until = until
+        self._last_scan = now
+        return scheduled
+
+    def _forget(self, before: datetime) -> None:
+        """Drop tasks due before `before`; scans no longer read them."""
+        expired = [
+            task_id
+            for task_id, due_date in self._scheduled.items()
+            if due_date <= before
+        ]
+        for task_id in expired:
+            del self._scheduled[task_id]
+
+    def _schedule(self, task_id, due_date: datetime, now: datetime) -> int:
+        if self._scheduled.get(task_id) == due_date:
+            return 0
+        self._scheduled[task_id] = due_date
+        if due_date > now:
+            heapq.heappush(
+                self._heap,
+                (due_date - self.due_soon, next(self._sequence), DUE_SOON, task_id),
+            )
+        heapq.heappush(self._heap, (due_date, next(self._sequence), OVERDUE, task_id))
+        return 1
+
+    def fire(self, db: Session, now: datetime) -> int:
+        """Hand every reminder whose fire time has passed to the handler, in batches."""
+        due: Dict[str, Dict[object, datetime]] = {DUE_SOON: {}, OVERDUE: {}}
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, _, kind, task_id = heapq.heappop(self._heap)
+            due_date = self._scheduled.get(task_id)
+            if due_date is None:
+                continue
+            if kind == OVERDUE:
+                if due_date != fire_at:
+                    continue
+            elif due_date - self.due_soon != fire_at:
+                continue
+            due[kind][task_id] = due_date
+
+        fired = 0
+        for kind, expected in due.items():
+            ids = list(expected)
+            for offset in range(0, len(ids), self.batch_size):
+                chunk = ids[offset:offset + self.batch_size]
+                fired += self._send(
+                    db, kind, {task_id: expected[task_id] for task_id in chunk}
+                )
+        return fired
+
+    def _send(self, db: Session, kind: str, expected: Dict[object, datetime]) -> int:
+        """
+        Claim and send one batch of reminders. The claim re-checks each task
+        against the database (it may have been completed, deleted or
+        rescheduled since it was queued, or reminded by another process) and
+        commits together with the handler call.
+        """
+        marker = Task.overdue_reminder_for if kind == OVERDUE else Task.due_soon_reminder_for
+        claimed = db.execute(
+            update(Task)
+            .where(
+                Task.id.in_(expected),
+                *_open_task_criteria(),
+                Task.due_date == case(expected, value=Task.id),
+                or_(marker.is_(None), marker != Task.due_date),
+            )
+            # Recording a reminder is not an edit
+            .values({marker: Task.due_date, Task.updated_at: Task.updated_at})
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        if not claimed:
+            db.commit()
+            return 0
+        try:
+            self.handler(kind, db.query(Task).filter(Task.id.in_(claimed)).all())
+        except BaseException:
+            db.rollback()
+            raise
+        db.commit()
+        return len(claimed)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the task scheduler")
+    parser.add_argument(
+        "--shard", default=DEFAULT_SHARD, help="Database shard to schedule"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    Scheduler(session_factory=shards.sessionmaker(args.shard)).run_forever()
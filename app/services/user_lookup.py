@@ -0,0 +1,123 @@
+import threading
+from collections import Counter
+from typing import Any, Dict, Hashable, Optional
+from sqlalchemy.orm import Session
+from app.core.cache import MISSING, TTLCache
+from app.core.config import settings
+from app.models.user import User
+from app.schemas.user import UserResponse
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Optional[UserResponse] = None
+        self.error: Optional[BaseException] = None
+
+
+class UserLookup:
+    """
+    Cached user lookups by id, username or email.
+
+    Entries are detached `UserResponse` snapshots shared by every key of the
+    same user, misses are cached for a shorter time, and concurrent lookups of
+    the same key share a single query. Keys are namespaced by database shard.
+
+    Lookups block, so callers must run in worker threads (plain `def`
+    handlers), never on the event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, negative_ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, _Call] = {}
+        self._stats: Counter = Counter()
+
+    def by_id(self, db: Session, user_id) -> Optional[UserResponse]:
+        return self._lookup(db, "id", user_id, User.id == user_id)
+
+    def by_username(self, db: Session, username: str) -> Optional[UserResponse]:
+        return self._lookup(db, "username", username, User.username == username)
+
+    def by_email(self, db: Session, email: str) -> Optional[UserResponse]:
+        return self._lookup(db, "email", email, User.email == email)
+
+    def prime(self, db: Session, user: User) -> None:
+        snapshot = UserResponse.model_validate(user)
+        for key in self._keys(db, snapshot):
+            self._cache.set(key, snapshot)
+
+    def invalidate(self, db: Session, user: User) -> None:
+        for key in self._keys(db, user):
+            self._cache.pop(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats.get("hits", 0) + stats.get("misses", 0)
+        stats["hit_rate"] = stats.get("hits", 0) / lookups if lookups else 0.0
+        return stats
+
+    def _count(self, *names: str) -> None:
+        with self._lock:
+            for name in names:
+                self._stats[name] += 1
+
+    @staticmethod
+    def _keys(db: Session, user):
+        shard = db.info.get("shard")
+        return (
+            (shard, "id", user.id),
+            (shard, "username", user.username),
+            (shard, "email", user.email),
+        )
+
+    def _lookup(self, db: Session, kind: str, value, criterion) -> Optional[UserResponse]:
+        key = (db.info.get("shard"), kind, value)
+        cached = self._cache.get(key)
+        if cached is not MISSING:
+            self._count("hits")
+            return cached
+
+        with self._lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            self._count("hits", "coalesced")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        self._count("misses")
+        try:
+            user = db.query(User).filter(criterion).first()
+            self._count("db_queries")
+            if user is None:
+                self._cache.set(key, None, ttl=self._negative_ttl)
+            else:
+                call.result = UserResponse.model_validate(user)
+                for user_key in self._keys(db, call.result):
+                    self._cache.set(user_key, call.result)
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            call.event.set()
+        return call.result
+
+
+user_lookup = UserLookup(
+    maxsize=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    negative_ttl=settings.USER_CACHE_NEGATIVE_TTL_SECONDS,
+)
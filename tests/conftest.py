@@ -0,0 +1,113 @@
+import os
+
+# Settings are read at import time; tests run without a .env file
+for name, value in {
+    "DB_USER": "test",
+    "DB_PASS": "test",
+    "DB_ENV": "localhost",
+    "DB_NAME": "test",
+    "SECRET_KEY": "test-secret",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+}.items():
+    os.environ.setdefault(name, value)
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.core.security import create_access_token
+from app.db.database import Base, get_db, get_default_db
+from app.db.pagination import count_cache
+from app.main import app
+from app.models.workspace import Workspace
+from app.models.user import User
+from app.models.task import Task  # noqa: F401
+from app.models.recurring_task import RecurringTask  # noqa: F401
+from app.services.user_lookup import user_lookup
+
+
+@compiles(UUID, "sqlite")
+def _compile_uuid_sqlite(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, autoflush=False, info={"shard": "default"})
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def make_user(db):
+    """Creates a user, in a new workspace unless `workspace_id` is given."""
+
+    def make_user(username, workspace_id=None, is_admin=False):
+        if workspace_id is None:
+            workspace = Workspace(name=f"{username}'s workspace")
+            db.add(workspace)
+            db.flush()
+            workspace_id = workspace.id
+        user = User(
+            workspace_id=workspace_id,
+            email=f"{username}@example.com",
+            username=username,
+            hashed_password="x",
+            full_name=username.title(),
+            is_admin=is_admin,
+        )
+        db.add(user)
+        db.commit()
+        return user
+
+    return make_user
+
+
+@pytest.fixture
+def user(make_user):
+    return make_user("admin", is_admin=True)
+
+
+@pytest.fixture
+def client(session_factory):
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    # Module-level caches would otherwise carry entries between tests
+    user_lookup.clear()
+    count_cache.clear()
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_default_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def auth_headers():
+    def auth_headers(user):
+        token = create_access_token(
+            {"sub": user.username, "ws": str(user.workspace_id)}
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+    return auth_headers
@@ -0,0 +1,48 @@
+from starlette.requests import Request
+
+from app.core.security import create_access_token
+from app.db.database import ShardRegistry, resolve_workspace
+
+registry = ShardRegistry(
+    {"default": "sqlite://", "eu": "sqlite://"}, {"eu-workspace": "eu"}
+)
+
+
+def request(**headers):
+    return Request(
+        {
+            "type": "http",
+            "headers": [
+                (name.replace("_", "-").lower().encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def bearer(workspace_id):
+    return "Bearer " + create_access_token({"sub": "admin", "ws": workspace_id})
+
+
+def test_token_claim_wins_over_header():
+    resolved = resolve_workspace(
+        request(Authorization=bearer("home"), X_Workspace_ID="eu-workspace")
+    )
+    assert resolved == "home"
+    assert registry.shard_for(resolved) == "default"
+
+
+def test_header_routes_unauthenticated_requests():
+    assert registry.shard_for(resolve_workspace(request(X_Workspace_ID="eu-workspace"))) == "eu"
+
+
+def test_header_is_used_when_the_token_is_invalid():
+    resolved = resolve_workspace(
+        request(Authorization="Bearer garbage", X_Workspace_ID="eu-workspace")
+    )
+    assert resolved == "eu-workspace"
+
+
+def test_sessions_are_tagged_with_their_shard():
+    assert registry.sessionmaker("eu")().info == {"shard": "eu"}
+    assert registry.engine("eu") is not registry.engine()
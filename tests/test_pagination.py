@@ -0,0 +1,281 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+import random
+
+import pytest
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.db import pagination
+from app.db.pagination import (
+    SortKey,
+    _after,
+    _dump_value,
+    _load_value,
+    _sort_expression,
+    count_cache,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+    parse_cursor,
+)
+from app.models.task import Task, TaskPriority
+from app.schemas.pagination import CountMode
+
+SPECS = [
+    "due_date",
+    "-due_date",
+    "priority",
+    "-priority",
+    "updated_at",
+    "-updated_at",
+    "due_date,-priority",
+    "-priority,due_date",
+    "priority,-updated_at,due_date",
+    "-due_date,priority,updated_at",
+]
+RANK = {priority: rank for rank, priority in enumerate(TaskPriority)}
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def sort_keys(spec):
+    return [
+        SortKey(getattr(Task, name.lstrip("-")), descending=name.startswith("-"))
+        for name in spec.split(",")
+    ]
+
+
+@pytest.fixture
+def tasks(db, user):
+    rnd = random.Random(7)
+    for index in range(40):
+        task = Task(
+            workspace_id=user.workspace_id,
+            title=f"task {index}",
+            description="",
+            created_by=user.id,
+            priority=rnd.choice(list(TaskPriority)),
+            # Few distinct values, so most sort keys tie; a quarter has no due date
+            due_date=None if index % 4 == 0 else BASE + timedelta(days=rnd.randrange(5)),
+        )
+        if index % 3:
+            task.updated_at = BASE + timedelta(hours=rnd.randrange(3))
+        # otherwise updated_at comes from the database's now()
+        db.add(task)
+    db.commit()
+    return db.query(Task).all()
+
+
+def value(task, name):
+    if name == "priority":
+        return RANK[task.priority]
+    return getattr(task, name)
+
+
+def expected_order(tasks, spec):
+    """Reference order: NULLs sort as the largest value, ties broken by id."""
+    keys = sort_keys(spec)
+    ordered = sorted(tasks, key=lambda task: str(task.id), reverse=keys[-1].descending)
+    for key in reversed(keys):
+        name = key.column.key
+        present = [task for task in ordered if value(task, name) is not None]
+        missing = [task for task in ordered if value(task, name) is None]
+        present.sort(key=lambda task: value(task, name), reverse=key.descending)
+        ordered = missing + present if key.descending else present + missing
+    return [task.id for task in ordered]
+
+
+@pytest.mark.parametrize("spec", SPECS)
+def test_after_selects_exactly_the_following_rows(db, tasks, spec):
+    keys = sort_keys(spec)
+    expressions = [
+        (_sort_expression(key.column, "sqlite"), key.descending, key.column.nullable)
+        for key in keys
+    ] + [(Task.id, keys[-1].descending, False)]
+    order = expected_order(tasks, spec)
+    by_id = {task.id: task for task in tasks}
+
+    for position, task_id in enumerate(order):
+        task = by_id[task_id]
+        values = [
+            _load_value(key.column, _dump_value(getattr(task, key.column.key)), "sqlite")
+            for key in keys
+        ] + [task.id]
+        # The segments cover the following rows in order, without gaps or overlap
+        start = position + 1
+        for condition in _after(expressions, values):
+            segment = {row.id for row in db.query(Task).filter(condition)}
+            assert segment == set(order[start:start + len(segment)])
+            start += len(segment)
+        assert start == len(order)
+
+
+@pytest.mark.parametrize("spec", SPECS)
+def test_pages_follow_the_sort_order(db, tasks, spec):
+    sort = sort_keys(spec)
+    seen, cursor = [], None
+    while True:
+        after = None
+        if cursor:
+            after = parse_cursor(decode_cursor(cursor), Task.id, "sqlite", sort=sort)
+        rows, next_cursor = paginate(db.query(Task), Task.id, limit=6, after=after, sort=sort)
+        seen.extend(row.id for row in rows)
+        if next_cursor is None:
+            break
+        assert next_cursor != cursor
+        cursor = next_cursor
+
+    assert seen == expected_order(tasks, spec)
+
+
+def test_unsorted_pages_keep_id_cursors(db, tasks):
+    rows, cursor = paginate(db.query(Task), Task.id, limit=5)
+    assert decode_cursor(cursor) == [str(rows[-1].id)]
+
+
+@pytest.mark.parametrize("spec", ["due_date", "-due_date", "updated_at", "-updated_at"])
+@pytest.mark.parametrize("position", [390, 1590, 1990])
+def test_deep_pages_search_the_sort_index(db, user, spec, position):
+    # A fifth of the tasks has no due date; the pages after 390 and 1590
+    # cross between dated and undated tasks. Every query of a page has to
+    # start from the cursor in the index rather than scan the workspace
+    # from the start
+    for index in range(2000):
+        db.add(Task(
+            workspace_id=user.workspace_id,
+            title=f"task {index}",
+            description="",
+            created_by=user.id,
+            due_date=None if index % 5 == 0 else BASE + timedelta(minutes=index),
+            updated_at=BASE + timedelta(seconds=index),
+        ))
+    db.commit()
+    sort = sort_keys(spec)
+    query = db.query(Task).filter(Task.workspace_id == user.workspace_id)
+    rows, cursor = paginate(query, Task.id, limit=position, sort=sort)
+    after = parse_cursor(decode_cursor(cursor), Task.id, "sqlite", sort=sort)
+
+    statements = []
+    engine = db.get_bind()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        page, _ = paginate(query, Task.id, limit=20, after=after, sort=sort)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert [row.id for row in rows + page] == expected_order(query.all(), spec)[:position + 20]
+    name = sort[0].column.key
+    for statement, parameters in statements:
+        plan = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        assert f"INDEX ix_tasks_workspace_id_{name} (workspace_id=? AND {name}" in str(plan.all())
+
+
+def test_cursor_from_another_sort_is_rejected(db, tasks):
+    _, cursor = paginate(db.query(Task), Task.id, limit=5, sort=sort_keys("due_date"))
+    after = decode_cursor(cursor)
+
+    for sort in (sort_keys("updated_at"), sort_keys("-due_date"), ()):
+        with pytest.raises(ValueError):
+            parse_cursor(after, Task.id, "sqlite", sort=sort)
+
+
+@pytest.mark.parametrize(
+    "after",
+    [
+        ["due_date", 5, "00000000-0000-0000-0000-000000000000"],
+        ["due_date", "yesterday", "00000000-0000-0000-0000-000000000000"],
+        ["due_date", None, None],
+        ["due_date", None],
+    ],
+)
+def test_malformed_cursor_values_are_rejected(after):
+    with pytest.raises(ValueError):
+        parse_cursor(after, Task.id, "sqlite", sort=sort_keys("due_date"))
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(["due_date", None, "x"])) == ["due_date", None, "x"]
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor!")
+
+
+class FakeQuery:
+    def __init__(self, rows):
+        self.rows = rows
+        self.counts = 0
+
+    def order_by(self, *clauses):
+        return self
+
+    def count(self):
+        self.counts += 1
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, dialect):
+        self.dialect = SimpleNamespace(name=dialect)
+
+    def get_bind(self):
+        return self
+
+
+@pytest.fixture
+def planner(monkeypatch):
+    estimates = []
+    monkeypatch.setattr(pagination, "_planner_estimate", lambda db, query: estimates.pop())
+    return estimates
+
+
+@pytest.fixture(autouse=True)
+def empty_count_cache():
+    count_cache.clear()
+    yield
+    count_cache.clear()
+
+
+def test_count_none_skips_counting():
+    query = FakeQuery(5)
+    assert count_rows(FakeSession("sqlite"), query, CountMode.none, "k") is None
+    assert query.counts == 0
+
+
+def test_count_exact_always_counts():
+    query = FakeQuery(5)
+    for _ in range(2):
+        assert count_rows(FakeSession("sqlite"), query, CountMode.exact, "k") == 5
+    assert query.counts == 2
+
+
+def test_count_estimated_caches_exact_count_without_planner():
+    query = FakeQuery(5)
+    for _ in range(2):
+        assert count_rows(FakeSession("sqlite"), query, CountMode.estimated, "k") == 5
+    assert query.counts == 1
+    # Different filters have their own entry
+    assert count_rows(FakeSession("sqlite"), FakeQuery(7), CountMode.estimated, "j") == 7
+
+
+def test_count_estimated_uses_large_planner_estimates(planner):
+    planner.append(settings.COUNT_EXACT_THRESHOLD * 3)
+    query = FakeQuery(5)
+    session = FakeSession("postgresql")
+
+    for _ in range(2):
+        total = count_rows(session, query, CountMode.estimated, "k")
+        assert total == settings.COUNT_EXACT_THRESHOLD * 3
+    assert query.counts == 0
+    assert planner == []
+
+
+def test_count_estimated_verifies_small_planner_estimates(planner):
+    planner.append(settings.COUNT_EXACT_THRESHOLD - 1)
+    query = FakeQuery(42)
+
+    assert count_rows(FakeSession("postgresql"), query, CountMode.estimated, "k") == 42
+    assert query.counts == 1
@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models.recurring_task import RecurrenceFrequency
+from app.services.recurrence import CronExpression, next_occurrence
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "expression, after, expected",
+    [
+        ("*/15 * * * *", utc(2026, 1, 1, 10, 7), utc(2026, 1, 1, 10, 15)),
+        ("*/15 * * * *", utc(2026, 1, 1, 10, 15), utc(2026, 1, 1, 10, 30)),
+        ("0 9 * * *", utc(2026, 1, 1, 9, 0, 30), utc(2026, 1, 2, 9, 0)),
+        ("30 8-10 * * *", utc(2026, 1, 1, 10, 45), utc(2026, 1, 2, 8, 30)),
+        # 2026-01-02 is a Friday, so the next weekday run is Monday
+        ("0 9 * * 1-5", utc(2026, 1, 2, 12, 0), utc(2026, 1, 5, 9, 0)),
+        ("0 0 * * 7", utc(2026, 1, 1), utc(2026, 1, 4)),
+        ("0 0 1 */3 *", utc(2026, 2, 10), utc(2026, 4, 1)),
+        ("0 0 29 2 *", utc(2026, 3, 1), utc(2028, 2, 29)),
+        ("59 23 31 12 *", utc(2026, 12, 31, 23, 59), utc(2027, 12, 31, 23, 59)),
+        # Restricted day-of-month and day-of-week match on either
+        ("0 0 13 * 5", utc(2026, 2, 1), utc(2026, 2, 6)),
+    ],
+)
+def test_cron_next_after(expression, after, expected):
+    assert CronExpression(expression).next_after(after) == expected
+
+
+def test_cron_treats_naive_datetimes_as_utc():
+    assert CronExpression("0 * * * *").next_after(datetime(2026, 1, 1, 5, 30)) == utc(
+        2026, 1, 1, 6, 0
+    )
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["* * * *", "60 * * * *", "* 24 * * *", "0 0 0 * *", "*/0 * * * *", "a * * * *"],
+)
+def test_cron_rejects_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronExpression(expression)
+
+
+def test_cron_that_never_matches_raises():
+    with pytest.raises(ValueError):
+        CronExpression("0 0 31 2 *").next_after(utc(2026, 1, 1))
+
+
+def test_daily_occurrences():
+    start = utc(2026, 1, 1, 9)
+    assert next_occurrence(RecurrenceFrequency.daily, start, utc(2025, 12, 1)) == start
+    assert next_occurrence(RecurrenceFrequency.daily, start, start) == utc(2026, 1, 2, 9)
+    assert next_occurrence(
+        RecurrenceFrequency.daily, start, utc(2026, 1, 2, 10), interval=3
+    ) == utc(2026, 1, 4, 9)
+
+
+def test_weekly_occurrences():
+    # 2026-01-05 is a Monday
+    start = utc(2026, 1, 5, 9)
+    weekly = RecurrenceFrequency.weekly
+    assert next_occurrence(weekly, start, start) == utc(2026, 1, 12, 9)
+    assert next_occurrence(weekly, start, start, weekdays=[0, 2]) == utc(2026, 1, 7, 9)
+    assert next_occurrence(
+        weekly, start, utc(2026, 1, 7, 9), interval=2, weekdays=[0, 2]
+    ) == utc(2026, 1, 19, 9)
+    # Weekdays before start_at in its first week are skipped
+    assert next_occurrence(
+        weekly, utc(2026, 1, 7, 9), utc(2026, 1, 1), weekdays=[0, 2]
+    ) == utc(2026, 1, 7, 9)
+
+
+def test_cron_occurrences_never_start_early():
+    start = utc(2026, 1, 1, 9)
+    cron = RecurrenceFrequency.cron
+    assert next_occurrence(cron, start, utc(2025, 1, 1), cron_expression="0 9 * * *") == start
+    assert next_occurrence(
+        cron, start, start, cron_expression="0 9 * * *"
+    ) == utc(2026, 1, 2, 9)
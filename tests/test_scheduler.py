@@ -0,0 +1,212 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.recurring_task import RecurrenceFrequency, RecurringTask
+from app.models.task import Task, TaskStatus
+from app.services.scheduler import DUE_SOON, OVERDUE, Scheduler
+
+NOW = datetime(2026, 3, 2, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def reminders():
+    return []
+
+
+@pytest.fixture
+def scheduler(session_factory, reminders):
+    def handler(kind, tasks):
+        reminders.extend((kind, task.title) for task in tasks)
+
+    return Scheduler(
+        session_factory=session_factory,
+        handler=handler,
+        batch_size=2,
+        due_soon=timedelta(hours=1),
+        horizon=timedelta(hours=24),
+        lookback=timedelta(hours=24),
+        edit_overlap=timedelta(minutes=1),
+    )
+
+
+def add_task(db, user, title, due_date, **kwargs):
+    task = Task(
+        workspace_id=user.workspace_id,
+        title=title,
+        description="",
+        created_by=user.id,
+        due_date=due_date,
+        updated_at=NOW - timedelta(days=1),
+        **kwargs,
+    )
+    db.add(task)
+    db.commit()
+    return task
+
+
+def edit(db, task, at, **changes):
+    for name, value in changes.items():
+        setattr(task, name, value)
+    task.updated_at = at
+    db.commit()
+
+
+def test_reminders_fire_once_each(db, user, scheduler, reminders):
+    add_task(db, user, "soon", NOW + timedelta(minutes=30))
+    add_task(db, user, "later", NOW + timedelta(hours=3))
+    add_task(db, user, "undated", None)
+
+    scheduler.run_once(NOW)
+    assert reminders == [(DUE_SOON, "soon")]
+
+    scheduler.run_once(NOW + timedelta(minutes=31))
+    scheduler.run_once(NOW + timedelta(minutes=32))
+    assert reminders == [(DUE_SOON, "soon"), (OVERDUE, "soon")]
+
+    scheduler.run_once(NOW + timedelta(hours=3))
+    assert reminders[2:] == [(DUE_SOON, "later"), (OVERDUE, "later")]
+
+
+def test_many_tasks_are_read_in_batches(db, user, scheduler, reminders):
+    for index in range(5):
+        add_task(db, user, f"task {index}", NOW - timedelta(minutes=index + 1))
+
+    scheduler.run_once(NOW)
+
+    assert sorted(reminders) == [(OVERDUE, f"task {index}") for index in range(5)]
+
+
+def test_editing_overdue_task_does_not_fire_again(db, user, scheduler, reminders):
+    task = add_task(db, user, "late", NOW - timedelta(hours=1))
+    scheduler.run_once(NOW)
+    assert reminders == [(OVERDUE, "late")]
+
+    edit(db, task, NOW + timedelta(minutes=1), title="late (renamed)")
+    scheduler.run_once(NOW + timedelta(minutes=2))
+    scheduler.run_once(NOW + timedelta(minutes=3))
+
+    assert reminders == [(OVERDUE, "late")]
+
+
+def test_moving_due_date_schedules_new_reminders(db, user, scheduler, reminders):
+    task = add_task(db, user, "moved", NOW - timedelta(hours=1))
+    scheduler.run_once(NOW)
+
+    edit(db, task, NOW + timedelta(minutes=1), due_date=NOW + timedelta(hours=3))
+    scheduler.run_once(NOW + timedelta(minutes=2))
+    assert reminders == [(OVERDUE, "moved")]
+
+    scheduler.run_once(NOW + timedelta(hours=2, minutes=1))
+    scheduler.run_once(NOW + timedelta(hours=3, minutes=1))
+    assert reminders == [(OVERDUE, "moved"), (DUE_SOON, "moved"), (OVERDUE, "moved")]
+
+
+def test_closed_tasks_are_not_reminded(db, user, scheduler, reminders):
+    task = add_task(db, user, "done", NOW + timedelta(hours=2))
+    add_task(db, user, "cancelled", NOW - timedelta(minutes=5), status=TaskStatus.cancelled)
+    scheduler.run_once(NOW)
+
+    edit(db, task, NOW + timedelta(minutes=1), status=TaskStatus.completed)
+    scheduler.run_once(NOW + timedelta(hours=3))
+
+    assert reminders == []
+
+
+def test_edit_committed_after_the_scan_is_picked_up(db, user, scheduler, reminders):
+    task = add_task(db, user, "pulled in", NOW + timedelta(days=3))
+    scheduler.run_once(NOW)
+
+    # The edit's transaction started before the previous scan, so its
+    # updated_at is older than that scan
+    edit(db, task, NOW - timedelta(seconds=10), due_date=NOW + timedelta(minutes=30))
+    scheduler.run_once(NOW + timedelta(seconds=30))
+
+    assert reminders == [(DUE_SOON, "pulled in")]
+
+
+def make_scheduler(session_factory, reminders):
+    return Scheduler(
+        session_factory=session_factory,
+        handler=lambda kind, tasks: reminders.extend((kind, task.title) for task in tasks),
+        due_soon=timedelta(hours=1),
+    )
+
+
+def test_restart_does_not_repeat_reminders(db, user, session_factory, reminders):
+    add_task(db, user, "late", NOW - timedelta(hours=2))
+    add_task(db, user, "soon", NOW + timedelta(minutes=30))
+    make_scheduler(session_factory, reminders).run_once(NOW)
+    assert sorted(reminders) == [(DUE_SOON, "soon"), (OVERDUE, "late")]
+
+    make_scheduler(session_factory, reminders).run_once(NOW + timedelta(minutes=1))
+
+    assert len(reminders) == 2
+
+
+def test_scheduler_processes_share_reminders(db, user, session_factory, reminders):
+    add_task(db, user, "late", NOW - timedelta(hours=2))
+    first = make_scheduler(session_factory, reminders)
+    second = make_scheduler(session_factory, reminders)
+
+    first.run_once(NOW)
+    second.run_once(NOW)
+
+    assert reminders == [(OVERDUE, "late")]
+
+
+def test_sending_a_reminder_is_not_an_edit(db, user, scheduler):
+    task = add_task(db, user, "late", NOW - timedelta(hours=2))
+    scheduler.run_once(NOW)
+
+    db.refresh(task)
+    assert task.updated_at.replace(tzinfo=timezone.utc) == NOW - timedelta(days=1)
+    assert task.overdue_reminder_for.replace(tzinfo=timezone.utc) == NOW - timedelta(hours=2)
+    assert task.due_soon_reminder_for is None
+
+
+def test_failed_handler_leaves_the_reminder_unsent(db, user, session_factory, reminders):
+    add_task(db, user, "late", NOW - timedelta(hours=2))
+
+    def failing(kind, tasks):
+        raise RuntimeError("mail server down")
+
+    with pytest.raises(RuntimeError):
+        Scheduler(session_factory=session_factory, handler=failing).run_once(NOW)
+
+    make_scheduler(session_factory, reminders).run_once(NOW + timedelta(minutes=1))
+    assert reminders == [(OVERDUE, "late")]
+
+
+def test_moved_due_date_is_reminded_again_after_restart(db, user, session_factory, reminders):
+    task = add_task(db, user, "moved", NOW - timedelta(hours=2))
+    make_scheduler(session_factory, reminders).run_once(NOW)
+
+    edit(db, task, NOW, due_date=NOW - timedelta(hours=1))
+    make_scheduler(session_factory, reminders).run_once(NOW + timedelta(minutes=1))
+
+    assert reminders == [(OVERDUE, "moved"), (OVERDUE, "moved")]
+
+
+def test_materialize_creates_each_occurrence_once(db, user, scheduler):
+    db.add(
+        RecurringTask(
+            workspace_id=user.workspace_id,
+            title="standup",
+            frequency=RecurrenceFrequency.daily,
+            interval=1,
+            start_at=NOW - timedelta(hours=2),
+            next_run_at=NOW - timedelta(hours=2),
+            created_by=user.id,
+        )
+    )
+    db.commit()
+
+    scheduler.run_once(NOW)
+    scheduler.run_once(NOW + timedelta(minutes=1))
+
+    due_dates = [
+        due_date.replace(tzinfo=timezone.utc)
+        for (due_date,) in db.query(Task.due_date).order_by(Task.due_date)
+    ]
+    assert due_dates == [NOW - timedelta(hours=2), NOW + timedelta(hours=22)]
@@ -0,0 +1,150 @@
+import pytest
+
+from app.core.config import settings
+from app.models.task import Task
+
+
+@pytest.fixture
+def tasks(db, user, make_user):
+    assignee = make_user("alice", workspace_id=user.workspace_id)
+    tasks = [
+        Task(
+            workspace_id=user.workspace_id,
+            title=f"task {index}",
+            description="lorem ipsum " * 20,
+            created_by=user.id,
+            assignee_id=assignee.id if index % 2 else None,
+        )
+        for index in range(30)
+    ]
+    db.add_all(tasks)
+    db.commit()
+    return tasks
+
+
+def test_default_items_are_summaries_without_assignee(client, user, tasks, auth_headers):
+    response = client.get("/api/v1/tasks/", headers=auth_headers(user))
+
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert "assignee" not in item
+    assert {"id", "title", "status", "assignee_id", "workspace_id"} <= set(item)
+
+
+def test_fields_limit_each_item(client, user, tasks, auth_headers):
+    response = client.get(
+        "/api/v1/tasks/", params={"fields": "id, title"}, headers=auth_headers(user)
+    )
+
+    assert response.status_code == 200
+    assert all(set(item) == {"id", "title"} for item in response.json()["items"])
+
+
+def test_expand_assignee_embeds_the_user(client, user, tasks, auth_headers):
+    response = client.get(
+        "/api/v1/tasks/",
+        params={"fields": "id,assignee_id", "expand": "assignee", "limit": 100},
+        headers=auth_headers(user),
+    )
+
+    items = response.json()["items"]
+    assert all(set(item) == {"id", "assignee_id", "assignee"} for item in items)
+    assigned = [item for item in items if item["assignee_id"]]
+    assert assigned and all(
+        item["assignee"]["username"] == "alice"
+        and item["assignee"]["id"] == item["assignee_id"]
+        for item in assigned
+    )
+    assert all(item["assignee"] is None for item in items if not item["assignee_id"])
+
+
+@pytest.mark.parametrize(
+    "params, detail",
+    [
+        ({"fields": "id,secret"}, "Unknown task field(s): secret"),
+        ({"fields": "assignee"}, "Unknown task field(s): assignee"),
+        ({"expand": "creator"}, "Unknown expansion(s): creator"),
+        ({"sort": "title"}, "Unknown sort field: title"),
+        ({"sort": "--due_date"}, "Unknown sort field: -due_date"),
+        ({"sort": "due_date,-due_date"}, "Duplicate sort field: due_date"),
+    ],
+)
+def test_unknown_fields_and_expansions_are_rejected(
+    client, user, tasks, auth_headers, params, detail
+):
+    for path in ("/api/v1/tasks/", "/api/v1/tasks/my/tasks"):
+        response = client.get(path, params=params, headers=auth_headers(user))
+        assert response.status_code == 400
+        assert response.json()["detail"] == detail
+
+
+@pytest.mark.parametrize("encoding", ["br", "gzip"])
+def test_large_responses_are_compressed(client, user, tasks, auth_headers, encoding):
+    response = client.get(
+        "/api/v1/tasks/",
+        params={"limit": 30},
+        headers={**auth_headers(user), "Accept-Encoding": encoding},
+    )
+
+    assert response.headers["content-encoding"] == encoding
+    assert len(response.json()["items"]) == 30
+
+
+def test_small_responses_are_not_compressed(client, user, tasks, auth_headers):
+    response = client.get(
+        "/api/v1/tasks/",
+        params={"limit": 1, "fields": "id"},
+        headers={**auth_headers(user), "Accept-Encoding": "br, gzip"},
+    )
+
+    assert len(response.content) < settings.COMPRESSION_MINIMUM_SIZE
+    assert "content-encoding" not in response.headers
+
+
+def test_list_envelope_pages_through_every_task(client, user, tasks, auth_headers):
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 7, "count": "exact"}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/api/v1/tasks/", params=params, headers=auth_headers(user)).json()
+        assert set(body) == {"items", "next_cursor", "total"}
+        assert body["total"] == 30
+        seen.extend(item["id"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(str(task.id) for task in tasks)
+
+
+def test_count_none_returns_null_total(client, user, tasks, auth_headers):
+    body = client.get(
+        "/api/v1/tasks/", params={"count": "none"}, headers=auth_headers(user)
+    ).json()
+    assert body["total"] is None
+    assert len(body["items"]) == 10
+
+
+@pytest.mark.parametrize("cursor", ["garbage!", "WzFd", "WyJub3QtYS11dWlkIl0"])
+def test_invalid_cursor_is_rejected(client, user, tasks, auth_headers, cursor):
+    response = client.get(
+        "/api/v1/tasks/", params={"cursor": cursor}, headers=auth_headers(user)
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_query_errors_are_not_reported_as_bad_cursors(
+    client, user, tasks, auth_headers, monkeypatch
+):
+    cursor = client.get(
+        "/api/v1/tasks/", params={"limit": 2}, headers=auth_headers(user)
+    ).json()["next_cursor"]
+
+    def broken(*args, **kwargs):
+        raise TypeError("driver error")
+
+    monkeypatch.setattr("app.api.v1.pagination.paginate", broken)
+    with pytest.raises(TypeError):
+        client.get("/api/v1/tasks/", params={"cursor": cursor}, headers=auth_headers(user))
@@ -0,0 +1,150 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.services.user_lookup import UserLookup, user_lookup
+
+
+@pytest.fixture
+def lookup():
+    return UserLookup(maxsize=100, ttl=60, negative_ttl=0.2)
+
+
+@pytest.fixture
+def slow_queries(session_factory):
+    engine = session_factory.kw["bind"]
+
+    def delay(conn, cursor, statement, *args):
+        # Only user lookups by id, so authentication stays fast
+        if "WHERE users.id = " in statement:
+            time.sleep(0.2)
+
+    event.listen(engine, "before_cursor_execute", delay)
+    yield
+    event.remove(engine, "before_cursor_execute", delay)
+
+
+def test_hits_are_served_from_the_cache(db, user, lookup):
+    assert lookup.by_id(db, user.id).username == "admin"
+    assert lookup.by_username(db, "admin").id == user.id
+    assert lookup.by_email(db, "admin@example.com").id == user.id
+
+    assert lookup.stats()["db_queries"] == 1
+    assert lookup.stats()["hits"] == 2
+
+
+def test_concurrent_lookups_share_one_query(session_factory, user, lookup, slow_queries):
+    barrier = threading.Barrier(10)
+    results = []
+
+    def worker():
+        db = session_factory()
+        try:
+            barrier.wait()
+            results.append(lookup.by_id(db, user.id))
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [result.id for result in results] == [user.id] * 10
+    assert lookup.stats()["db_queries"] == 1
+    assert lookup.stats()["coalesced"] == 9
+
+
+def test_concurrent_requests_share_one_query(
+    client, make_user, user, auth_headers, slow_queries
+):
+    member = make_user("member", workspace_id=user.workspace_id)
+    barrier = threading.Barrier(10)
+    statuses = []
+
+    def request():
+        barrier.wait()
+        response = client.get(f"/api/v1/users/{member.id}", headers=auth_headers(user))
+        statuses.append(response.status_code)
+
+    # One portal, so every request is served by the same event loop
+    with client:
+        threads = [threading.Thread(target=request) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert statuses == [200] * 10
+    assert user_lookup.stats()["db_queries"] == 1
+    assert user_lookup.stats()["coalesced"] == 9
+
+
+def test_misses_expire_after_the_negative_ttl(db, make_user, lookup):
+    assert lookup.by_username(db, "late") is None
+    make_user("late")
+
+    assert lookup.by_username(db, "late") is None
+    time.sleep(0.25)
+    assert lookup.by_username(db, "late").username == "late"
+
+
+def test_keys_are_namespaced_by_shard(session_factory, user, lookup):
+    primary = session_factory(info={"shard": "default"})
+    other = session_factory(info={"shard": "eu"})
+
+    lookup.by_id(primary, user.id)
+    lookup.by_id(other, user.id)
+    lookup.by_id(other, user.id)
+
+    assert lookup.stats()["db_queries"] == 2
+
+
+def test_rename_frees_the_old_username(client, user, auth_headers):
+    response = client.put(
+        f"/api/v1/users/{user.id}", json={"username": "root"}, headers=auth_headers(user)
+    )
+    assert response.status_code == 200
+
+    # Tokens name their user, so log in again under the new name
+    headers = auth_headers(SimpleNamespace(username="root", workspace_id=user.workspace_id))
+    new_user = {"email": "new@example.com", "password": "password123", "full_name": "New"}
+    taken = client.post("/api/v1/users/", json={**new_user, "username": "root"}, headers=headers)
+    assert taken.status_code == 400
+    freed = client.post("/api/v1/users/", json={**new_user, "username": "admin"}, headers=headers)
+    assert freed.status_code == 201
+
+
+def test_lookup_racing_a_rename_does_not_keep_the_old_username(
+    client, session_factory, user, auth_headers
+):
+    looked_up = []
+
+    # Another request looks the user up while the rename is being committed
+    def concurrent_lookup(session):
+        if looked_up:
+            return
+        other = session_factory()
+        try:
+            looked_up.append(user_lookup.by_username(other, "admin"))
+        finally:
+            other.close()
+
+    event.listen(Session, "before_commit", concurrent_lookup)
+    try:
+        client.put(
+            f"/api/v1/users/{user.id}", json={"username": "root"}, headers=auth_headers(user)
+        )
+    finally:
+        event.remove(Session, "before_commit", concurrent_lookup)
+
+    assert looked_up[0].username == "admin"
+    db = session_factory()
+    assert user_lookup.by_username(db, "admin") is None
+    assert user_lookup.by_username(db, "root").id == user.id
+    db.close()
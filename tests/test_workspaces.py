@@ -0,0 +1,162 @@
+import pytest
+
+from app.core.security import create_access_token
+from app.models.recurring_task import RecurrenceFrequency, RecurringTask
+from app.models.task import Task
+
+
+@pytest.fixture
+def tenants(db, make_user):
+    """Two workspaces, each with an admin, a member and some tasks."""
+    tenants = {}
+    for name, task_count in (("acme", 3), ("globex", 5)):
+        admin = make_user(f"{name}_admin", is_admin=True)
+        member = make_user(f"{name}_member", workspace_id=admin.workspace_id)
+        tasks = [
+            Task(
+                workspace_id=admin.workspace_id,
+                title=f"{name} task {index}",
+                description="",
+                created_by=admin.id,
+                assignee_id=member.id,
+            )
+            for index in range(task_count)
+        ]
+        rule = RecurringTask(
+            workspace_id=admin.workspace_id,
+            title=f"{name} standup",
+            frequency=RecurrenceFrequency.daily,
+            interval=1,
+            start_at=admin.created_at,
+            next_run_at=admin.created_at,
+            created_by=admin.id,
+        )
+        db.add_all(tasks + [rule])
+        db.commit()
+        tenants[name] = {"admin": admin, "member": member, "tasks": tasks, "rule": rule}
+    return tenants
+
+
+def test_tasks_of_another_workspace_are_not_found(client, tenants, auth_headers):
+    headers = auth_headers(tenants["acme"]["admin"])
+    task_id = tenants["globex"]["tasks"][0].id
+
+    assert client.get(f"/api/v1/tasks/{task_id}", headers=headers).status_code == 404
+    assert client.put(
+        f"/api/v1/tasks/{task_id}", json={"title": "mine now"}, headers=headers
+    ).status_code == 404
+    assert client.delete(f"/api/v1/tasks/{task_id}", headers=headers).status_code == 404
+    assert client.delete(
+        f"/api/v1/recurring-tasks/{tenants['globex']['rule'].id}", headers=headers
+    ).status_code == 404
+
+
+def test_users_of_another_workspace_are_not_found(client, tenants, auth_headers):
+    headers = auth_headers(tenants["acme"]["admin"])
+    user_id = tenants["globex"]["member"].id
+
+    assert client.get(f"/api/v1/users/{user_id}", headers=headers).status_code == 404
+    assert client.put(
+        f"/api/v1/users/{user_id}", json={"full_name": "Taken"}, headers=headers
+    ).status_code == 404
+
+
+def test_assignees_from_another_workspace_are_rejected(client, tenants, auth_headers):
+    headers = auth_headers(tenants["acme"]["admin"])
+    outsider = str(tenants["globex"]["member"].id)
+    own_task = tenants["acme"]["tasks"][0].id
+
+    responses = [
+        client.post(
+            "/api/v1/tasks/",
+            json={"title": "t", "description": "", "assignee_id": outsider},
+            headers=headers,
+        ),
+        client.put(
+            f"/api/v1/tasks/{own_task}", json={"assignee_id": outsider}, headers=headers
+        ),
+        client.post(
+            "/api/v1/recurring-tasks/",
+            json={
+                "title": "t",
+                "assignee_id": outsider,
+                "frequency": "daily",
+                "start_at": "2030-01-01T09:00:00Z",
+            },
+            headers=headers,
+        ),
+    ]
+
+    for response in responses:
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Assignee not found"
+
+
+@pytest.mark.parametrize("count", ["exact", "estimated"])
+def test_lists_and_totals_stay_in_their_workspace(client, tenants, auth_headers, count):
+    # Ask the same questions in both workspaces, so a shared count-cache
+    # entry would show up as the wrong total
+    for name, expected in (("acme", 3), ("globex", 5), ("acme", 3)):
+        tenant = tenants[name]
+        headers = auth_headers(tenant["admin"])
+        params = {"count": count, "limit": 100}
+
+        tasks = client.get("/api/v1/tasks/", params=params, headers=headers).json()
+        assert tasks["total"] == expected
+        assert {item["id"] for item in tasks["items"]} == {
+            str(task.id) for task in tenant["tasks"]
+        }
+
+        users = client.get("/api/v1/users/", params=params, headers=headers).json()
+        assert users["total"] == 2
+        assert {item["username"] for item in users["items"]} == {
+            f"{name}_admin",
+            f"{name}_member",
+        }
+
+        rules = client.get("/api/v1/recurring-tasks/", params=params, headers=headers).json()
+        assert rules["total"] == 1
+        assert rules["items"][0]["title"] == f"{name} standup"
+
+        mine = client.get(
+            "/api/v1/tasks/my/tasks", params=params, headers=auth_headers(tenant["member"])
+        ).json()
+        assert mine["total"] == expected
+
+
+def test_filters_cannot_reach_into_another_workspace(client, tenants, auth_headers):
+    response = client.get(
+        "/api/v1/tasks/",
+        params={"assignee_id": str(tenants["globex"]["member"].id), "count": "exact"},
+        headers=auth_headers(tenants["acme"]["admin"]),
+    ).json()
+
+    assert response["items"] == []
+    assert response["total"] == 0
+
+
+def test_new_users_join_the_creators_workspace(client, tenants, auth_headers):
+    admin = tenants["acme"]["admin"]
+    response = client.post(
+        "/api/v1/users/",
+        json={
+            "email": "new@example.com",
+            "username": "new",
+            "password": "password123",
+            "full_name": "New",
+        },
+        headers=auth_headers(admin),
+    )
+
+    assert response.status_code == 201
+    assert response.json()["workspace_id"] == str(admin.workspace_id)
+
+
+def test_tokens_are_bound_to_their_workspace(client, tenants):
+    # A token claiming another workspace must not authenticate the user there
+    token = create_access_token(
+        {"sub": "acme_admin", "ws": str(tenants["globex"]["admin"].workspace_id)}
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 401